@@ -55,6 +55,22 @@ describe('ChatPersistence', () => {
     expect(parsedData[1].content).toBe('I will add a new vehicle for you')
   })
 
+  it('keeps only the most recent messages when saving long histories', () => {
+    const messages: ChatMessage[] = Array.from({ length: 250 }, (_, i) => ({
+      id: `msg-${i}`,
+      type: 'user',
+      content: `Message ${i}`,
+      timestamp: new Date('2024-01-01T12:00:00Z')
+    }))
+
+    ChatPersistence.saveMessages(messages)
+
+    const parsedData = JSON.parse(localStorage.getItem('vrp-assistant-chat-history')!)
+    expect(parsedData).toHaveLength(200)
+    expect(parsedData[0].id).toBe('msg-50')
+    expect(parsedData[199].id).toBe('msg-249')
+  })
+
   it('loads chat messages from localStorage', () => {
     const messages: ChatMessage[] = [
       {
@@ -0,0 +1,156 @@
+/**
+ * @jest-environment node
+ */
+
+import { NextRequest } from 'next/server'
+import { GET } from '@/app/api/vrp/load/[jobId]/route'
+
+const mockRetrieve = jest.fn()
+const mockSolution = jest.fn()
+const mockExplanation = jest.fn()
+
+jest.mock('@/lib/solvice-client', () => ({
+  getSolviceClient: () => ({
+    vrp: {
+      jobs: {
+        retrieve: (...args: unknown[]) => mockRetrieve(...args),
+        solution: (...args: unknown[]) => mockSolution(...args),
+        explanation: (...args: unknown[]) => mockExplanation(...args)
+      }
+    }
+  })
+}))
+
+const JOB_ID = '123e4567-e89b-12d3-a456-426614174000'
+
+// Each call uses its own client IP so the shared rate limiter never trips
+let requestCount = 0
+
+function upstream(body: string, contentType = 'application/json') {
+  return {
+    asResponse: () => Promise.resolve(new Response(body, { headers: { 'content-type': contentType } }))
+  }
+}
+
+function upstreamError(status: number) {
+  return {
+    asResponse: () => Promise.reject(Object.assign(new Error(`Upstream ${status}`), { status }))
+  }
+}
+
+function loadJob(headers: Record<string, string> = {}) {
+  requestCount++
+  const request = new NextRequest(`http://localhost/api/vrp/load/${JOB_ID}`, {
+    headers: { 'x-forwarded-for': `10.0.${Math.floor(requestCount / 250)}.${requestCount % 250}`, ...headers }
+  })
+  return GET(request, { params: Promise.resolve({ jobId: JOB_ID }) })
+}
+
+describe('GET /api/vrp/load/[jobId]', () => {
+  beforeEach(() => {
+    jest.clearAllMocks()
+    jest.spyOn(console, 'error').mockImplementation(() => {})
+    mockRetrieve.mockReturnValue(upstream('{"jobs":[{"name":"job-1"}],"resources":[]}'))
+    mockSolution.mockReturnValue(upstream('{"trips":[]}'))
+    mockExplanation.mockReturnValue(upstreamError(404))
+  })
+
+  afterEach(() => {
+    jest.restoreAllMocks()
+  })
+
+  describe('Upstream Bodies', () => {
+    it('splices upstream JSON into a valid response', async () => {
+      const response = await loadJob()
+
+      expect(response.status).toBe(200)
+      expect(response.headers.get('content-type')).toBe('application/json')
+      expect(await response.json()).toEqual({
+        request: { jobs: [{ name: 'job-1' }], resources: [] },
+        solution: { trips: [] },
+        solutionError: null,
+        explanation: null,
+        explanationError: 'Explanation not ready yet'
+      })
+    })
+
+    it('treats an empty upstream body as null', async () => {
+      mockSolution.mockReturnValue(upstream(''))
+
+      const response = await loadJob()
+      const data = await response.json()
+
+      expect(response.status).toBe(200)
+      expect(data.solution).toBeNull()
+      expect(data.solutionError).toBeNull()
+    })
+
+    it('returns 502 when the job request body is not JSON', async () => {
+      mockRetrieve.mockReturnValue(upstream('<html>Bad gateway</html>', 'text/html'))
+
+      const response = await loadJob()
+
+      expect(response.status).toBe(502)
+      expect(await response.json()).toEqual({ error: 'Invalid response from VRP API' })
+    })
+
+    it('returns 502 when the job request body is malformed JSON', async () => {
+      mockRetrieve.mockReturnValue(upstream('{"jobs":[{"name":'))
+
+      const response = await loadJob()
+
+      expect(response.status).toBe(502)
+    })
+
+    it('reports a non-JSON solution body as a fetch failure', async () => {
+      mockSolution.mockReturnValue(upstream('Service unavailable', 'text/plain'))
+
+      const response = await loadJob()
+      const data = await response.json()
+
+      expect(response.status).toBe(200)
+      expect(data.solution).toBeNull()
+      expect(data.solutionError).toBe('Failed to fetch solution')
+    })
+
+    it('returns 404 when the job does not exist', async () => {
+      mockRetrieve.mockReturnValue(upstreamError(404))
+
+      const response = await loadJob()
+
+      expect(response.status).toBe(404)
+      expect(await response.json()).toEqual({ error: 'Job not found' })
+    })
+  })
+
+  describe('ETag Revalidation', () => {
+    it('sends an ETag and revalidation cache headers', async () => {
+      const response = await loadJob()
+
+      expect(response.headers.get('etag')).toMatch(/^".+"$/)
+      expect(response.headers.get('cache-control')).toBe('private, no-cache')
+    })
+
+    it('returns 304 without a body when If-None-Match matches', async () => {
+      const etag = (await loadJob()).headers.get('etag')!
+
+      const response = await loadJob({ 'if-none-match': `"stale", W/${etag}` })
+
+      expect(response.status).toBe(304)
+      expect(response.headers.get('etag')).toBe(etag)
+      expect(response.headers.get('cache-control')).toBe('private, no-cache')
+      expect(await response.text()).toBe('')
+    })
+
+    it('returns the full body once the job changes', async () => {
+      const etag = (await loadJob()).headers.get('etag')!
+      mockExplanation.mockReturnValue(upstream('{"summary":"done"}'))
+
+      const response = await loadJob({ 'if-none-match': etag })
+
+      expect(response.status).toBe(200)
+      expect(response.headers.get('etag')).not.toBe(etag)
+      expect((await response.json()).explanation).toEqual({ summary: 'done' })
+    })
+  })
+})
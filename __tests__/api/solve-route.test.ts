@@ -0,0 +1,131 @@
+/**
+ * @jest-environment node
+ */
+
+import { NextRequest } from 'next/server'
+import { SolviceVrpSolver } from 'solvice-vrp-solver'
+import { POST } from '@/app/api/vrp/solve/route'
+import { getSampleVrpData } from '@/lib/sample-data'
+
+const mockSyncSolve = jest.fn()
+
+jest.mock('@/lib/solvice-client', () => ({
+  getSolviceClient: () => ({
+    vrp: {
+      syncSolve: (...args: unknown[]) => mockSyncSolve(...args)
+    }
+  })
+}))
+
+// Each call uses its own client IP so the shared rate limiter never trips
+let requestCount = 0
+
+function solve(body: unknown = getSampleVrpData('simple')) {
+  requestCount++
+  const request = new NextRequest('http://localhost/api/vrp/solve', {
+    method: 'POST',
+    headers: {
+      'content-type': 'application/json',
+      'x-forwarded-for': `10.1.${Math.floor(requestCount / 250)}.${requestCount % 250}`
+    },
+    body: JSON.stringify(body)
+  })
+  return POST(request)
+}
+
+// SDK errors are matched with instanceof, so build instances without
+// depending on the SDK's constructor signature
+function sdkError<T extends Error>(ErrorClass: abstract new (...args: never[]) => T, message: string): T {
+  return Object.assign(Object.create(ErrorClass.prototype) as T, { message })
+}
+
+function rejectWith(error: unknown) {
+  mockSyncSolve.mockReturnValue({ asResponse: () => Promise.reject(error) })
+}
+
+describe('POST /api/vrp/solve', () => {
+  beforeEach(() => {
+    jest.clearAllMocks()
+    jest.spyOn(console, 'error').mockImplementation(() => {})
+    jest.spyOn(console, 'warn').mockImplementation(() => {})
+  })
+
+  afterEach(() => {
+    jest.restoreAllMocks()
+  })
+
+  it('passes the upstream solution through with rate limit headers', async () => {
+    const solution = '{"trips":[{"resource":"vehicle-1","visits":[]}],"unserved":[]}'
+    mockSyncSolve.mockReturnValue({
+      asResponse: () => Promise.resolve(new Response(solution, {
+        status: 200,
+        headers: { 'content-type': 'application/json; charset=utf-8' }
+      }))
+    })
+
+    const response = await solve()
+
+    expect(response.status).toBe(200)
+    expect(response.headers.get('content-type')).toBe('application/json; charset=utf-8')
+    expect(response.headers.get('x-ratelimit-limit')).toBe('60')
+    expect(response.headers.get('x-ratelimit-remaining')).not.toBeNull()
+    expect(response.headers.get('x-ratelimit-reset')).not.toBeNull()
+    expect(await response.text()).toBe(solution)
+    expect(mockSyncSolve).toHaveBeenCalledTimes(1)
+  })
+
+  it('defaults the content type to JSON when upstream omits it', async () => {
+    mockSyncSolve.mockReturnValue({
+      asResponse: () => Promise.resolve(new Response(new Blob(['{"trips":[]}']).stream(), { status: 200 }))
+    })
+
+    const response = await solve()
+
+    expect(response.headers.get('content-type')).toBe('application/json')
+  })
+
+  it('maps SDK authentication errors to 401', async () => {
+    rejectWith(sdkError(SolviceVrpSolver.AuthenticationError, '401 Unauthorized'))
+
+    const response = await solve()
+
+    expect(response.status).toBe(401)
+    expect(await response.json()).toEqual({ error: 'Invalid API key', type: 'authentication' })
+  })
+
+  it('maps SDK bad request errors to 400', async () => {
+    rejectWith(sdkError(SolviceVrpSolver.BadRequestError, '400 Bad Request'))
+
+    const response = await solve()
+
+    expect(response.status).toBe(400)
+    expect(await response.json()).toEqual({ error: 'Invalid request data', type: 'validation' })
+  })
+
+  it('maps SDK unprocessable entity errors to 400', async () => {
+    rejectWith(sdkError(SolviceVrpSolver.UnprocessableEntityError, '422 Unprocessable Entity'))
+
+    const response = await solve()
+
+    expect(response.status).toBe(400)
+    expect(await response.json()).toEqual({ error: 'Invalid request data', type: 'validation' })
+  })
+
+  it('maps SDK timeouts to 408', async () => {
+    rejectWith(sdkError(SolviceVrpSolver.APIConnectionTimeoutError, 'Request timed out.'))
+
+    const response = await solve()
+
+    expect(response.status).toBe(408)
+    expect(await response.json()).toEqual({ error: 'Request timeout', type: 'timeout' })
+  })
+
+  it('maps unknown errors to 500', async () => {
+    rejectWith(new Error('socket hang up'))
+
+    const response = await solve()
+
+    expect(response.status).toBe(500)
+    expect(await response.json()).toEqual({ error: 'Internal server error', type: 'server' })
+  })
+})
@@ -0,0 +1,68 @@
+import { costGuardian } from '@/lib/cost-guardian'
+
+describe('Cost Guardian', () => {
+  beforeEach(() => {
+    jest.spyOn(console, 'log').mockImplementation(() => {})
+    jest.spyOn(console, 'warn').mockImplementation(() => {})
+    costGuardian.setDailyBudget(1)
+    costGuardian.reset()
+  })
+
+  afterEach(() => {
+    jest.restoreAllMocks()
+  })
+
+  describe('Budget Reservations', () => {
+    it('denies a reservation once in-flight reservations fill the budget', () => {
+      expect(costGuardian.reserveBudget(0.6).allowed).toBe(true)
+
+      const result = costGuardian.reserveBudget(0.6)
+
+      expect(result.allowed).toBe(false)
+      expect(result.currentSpend).toBe(0)
+      expect(result.reason).toContain('$0.60 reserved by in-flight requests')
+    })
+
+    it('restores headroom when a reservation is released', () => {
+      costGuardian.reserveBudget(0.6)
+      costGuardian.releaseBudget(0.6)
+
+      expect(costGuardian.reserveBudget(0.6).allowed).toBe(true)
+    })
+
+    it('never lets releases drop the reserved amount below zero', () => {
+      costGuardian.reserveBudget(0.1)
+      costGuardian.releaseBudget(5)
+
+      // A negative reservation would wrongly make room for this request
+      expect(costGuardian.reserveBudget(1.5).allowed).toBe(false)
+      expect(costGuardian.reserveBudget(1).allowed).toBe(true)
+    })
+
+    it('counts recorded spend and reservations together', () => {
+      costGuardian.recordCost(0.5)
+      costGuardian.reserveBudget(0.3)
+
+      const result = costGuardian.checkBudget(0.3)
+
+      expect(result.allowed).toBe(false)
+      expect(result.reason).toContain('Current spend: $0.50')
+    })
+
+    it('clears reservations on reset', () => {
+      costGuardian.reserveBudget(0.9)
+      costGuardian.reset()
+
+      expect(costGuardian.reserveBudget(0.9).allowed).toBe(true)
+    })
+
+    it('omits the reserved note when nothing is in flight', () => {
+      costGuardian.recordCost(0.9)
+
+      const result = costGuardian.checkBudget(0.5)
+
+      expect(result.allowed).toBe(false)
+      expect(result.reason).not.toContain('reserved')
+    })
+  })
+})
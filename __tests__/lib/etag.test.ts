@@ -0,0 +1,49 @@
+/**
+ * @jest-environment node
+ */
+
+import { createETag, matchesETag } from '@/lib/etag'
+
+describe('ETag', () => {
+  describe('createETag', () => {
+    it('creates a quoted tag that is stable for the same body', () => {
+      const etag = createETag('{"request":{}}')
+
+      expect(etag).toMatch(/^"[A-Za-z0-9_-]{22}"$/)
+      expect(createETag('{"request":{}}')).toBe(etag)
+    })
+
+    it('changes when the body changes', () => {
+      expect(createETag('{"solution":null}')).not.toBe(createETag('{"solution":{}}'))
+    })
+  })
+
+  describe('matchesETag', () => {
+    const etag = createETag('body')
+
+    it('does not match without an If-None-Match header', () => {
+      expect(matchesETag(null, etag)).toBe(false)
+      expect(matchesETag('', etag)).toBe(false)
+    })
+
+    it('matches the exact tag', () => {
+      expect(matchesETag(etag, etag)).toBe(true)
+    })
+
+    it('does not match a different tag', () => {
+      expect(matchesETag(createETag('other'), etag)).toBe(false)
+    })
+
+    it('matches a tag within a list', () => {
+      expect(matchesETag(`"stale", ${etag} ,"older"`, etag)).toBe(true)
+    })
+
+    it('matches a weak validator for the same tag', () => {
+      expect(matchesETag(`W/${etag}`, etag)).toBe(true)
+    })
+
+    it('matches the wildcard', () => {
+      expect(matchesETag('*', etag)).toBe(true)
+    })
+  })
+})
@@ -148,6 +148,25 @@ describe('JsonModificationService', () => {
       expect(result.modifiedData).toEqual(invalidData)
     })
 
+    it('should not throw on input missing jobs or resources when validation is disabled', async () => {
+      const partialInput = { jobs: sampleData.jobs } as Vrp.VrpSyncSolveParams
+
+      mockOpenAIService.modifyVrpData.mockResolvedValueOnce({
+        modifiedData: sampleData,
+        explanation: 'Added resources',
+        changes: []
+      })
+
+      const result = await service.processModificationRequest(
+        partialInput,
+        'Add a vehicle',
+        { validateResult: false }
+      )
+
+      expect(result.success).toBe(true)
+      expect(mockOpenAIService.modifyVrpData.mock.calls[0][0].context).toContain('0 resources')
+    })
+
     it('should validate input data before processing', async () => {
       const invalidInput = {
         jobs: [],
@@ -178,6 +178,30 @@ describe('Rate Limiter', () => {
     })
   })
 
+  describe('Memory Bound', () => {
+    it('evicts the least recently used key once the key limit is reached', () => {
+      let key = 'lru-first'
+      const limiter = rateLimit({
+        maxRequests: 1,
+        windowMs: 60000,
+        keyGenerator: () => key
+      })
+      const request = createMockRequest()
+
+      expect(limiter(request).allowed).toBe(true)
+      expect(limiter(request).allowed).toBe(false)
+
+      // Fill the store with other keys until the first one is evicted
+      for (let i = 0; i < 10_000; i++) {
+        key = `lru-filler-${i}`
+        limiter(request)
+      }
+
+      key = 'lru-first'
+      expect(limiter(request).allowed).toBe(true)
+    })
+  })
+
   describe('Custom Key Generator', () => {
     it('uses custom key generator', () => {
       const customLimiter = rateLimit({
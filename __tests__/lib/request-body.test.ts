@@ -0,0 +1,66 @@
+/**
+ * @jest-environment node
+ */
+
+import { readJsonBody, PayloadTooLargeError, payloadTooLargeResponse } from '@/lib/request-body'
+
+// Request with a streamed body and no Content-Length, like a chunked upload
+function createStreamedRequest(chunks: string[]): Request {
+  const encoder = new TextEncoder()
+  const stream = new ReadableStream<Uint8Array>({
+    start(controller) {
+      chunks.forEach(chunk => controller.enqueue(encoder.encode(chunk)))
+      controller.close()
+    }
+  })
+
+  return new Request('http://localhost/api/vrp/solve', {
+    method: 'POST',
+    body: stream,
+    duplex: 'half'
+  } as RequestInit)
+}
+
+describe('Request Body', () => {
+  describe('readJsonBody', () => {
+    it('parses a JSON body', async () => {
+      const request = new Request('http://localhost/api/vrp/solve', {
+        method: 'POST',
+        body: JSON.stringify({ jobs: [{ name: 'job-1' }] })
+      })
+
+      await expect(readJsonBody(request)).resolves.toEqual({ jobs: [{ name: 'job-1' }] })
+    })
+
+    it('parses a body streamed in several chunks', async () => {
+      const request = createStreamedRequest(['{"jobs":', '[{"name":"jöb-1"}]', '}'])
+
+      await expect(readJsonBody(request)).resolves.toEqual({ jobs: [{ name: 'jöb-1' }] })
+    })
+
+    it('rejects streamed bodies once they exceed the limit', async () => {
+      const request = createStreamedRequest(['{"data":"', 'x'.repeat(20), '"}'])
+
+      await expect(readJsonBody(request, 16)).rejects.toBeInstanceOf(PayloadTooLargeError)
+    })
+
+    it('rejects malformed JSON', async () => {
+      const request = createStreamedRequest(['{"jobs":'])
+
+      await expect(readJsonBody(request)).rejects.toBeInstanceOf(SyntaxError)
+    })
+  })
+
+  describe('payloadTooLargeResponse', () => {
+    it('returns a 413 with the size limit', async () => {
+      const response = payloadTooLargeResponse(2_000_000)
+
+      expect(response.status).toBe(413)
+      await expect(response.json()).resolves.toMatchObject({
+        type: 'payload_too_large',
+        maxSize: 1_000_000,
+        actualSize: 2_000_000
+      })
+    })
+  })
+})
@@ -0,0 +1,105 @@
+import { renderHook, act } from '@testing-library/react'
+import { useVrpMessages } from '@/lib/hooks/useVrpMessages'
+import { ChatPersistence } from '@/components/VrpAssistant/ChatPersistence'
+
+describe('useVrpMessages', () => {
+  let saveSpy: jest.SpyInstance
+
+  beforeEach(() => {
+    jest.useFakeTimers()
+    jest.spyOn(ChatPersistence, 'loadMessages').mockReturnValue([])
+    jest.spyOn(ChatPersistence, 'clearMessages').mockImplementation(() => {})
+    saveSpy = jest.spyOn(ChatPersistence, 'saveMessages').mockImplementation(() => {})
+  })
+
+  afterEach(() => {
+    jest.useRealTimers()
+    jest.restoreAllMocks()
+  })
+
+  const addBurst = (result: { current: ReturnType<typeof useVrpMessages> }) => {
+    act(() => {
+      result.current.addMessage('user', 'Add a vehicle')
+      result.current.addMessage('system', 'Processing...')
+    })
+    act(() => {
+      result.current.addMessage('assistant', 'Added vehicle-3')
+    })
+  }
+
+  it('coalesces a burst of messages into a single write', () => {
+    const { result } = renderHook(() => useVrpMessages())
+
+    addBurst(result)
+    expect(saveSpy).not.toHaveBeenCalled()
+
+    act(() => {
+      jest.advanceTimersByTime(300)
+    })
+
+    expect(saveSpy).toHaveBeenCalledTimes(1)
+    expect(saveSpy.mock.calls[0][0]).toHaveLength(3)
+  })
+
+  it('flushes a pending save on pagehide', () => {
+    const { result } = renderHook(() => useVrpMessages())
+
+    addBurst(result)
+    act(() => {
+      window.dispatchEvent(new Event('pagehide'))
+    })
+
+    expect(saveSpy).toHaveBeenCalledTimes(1)
+    expect(saveSpy.mock.calls[0][0]).toHaveLength(3)
+
+    act(() => {
+      jest.advanceTimersByTime(300)
+    })
+    expect(saveSpy).toHaveBeenCalledTimes(1)
+  })
+
+  it('flushes a pending save when the page becomes hidden', () => {
+    const { result } = renderHook(() => useVrpMessages())
+    const visibility = jest.spyOn(document, 'visibilityState', 'get')
+
+    addBurst(result)
+
+    visibility.mockReturnValue('visible')
+    act(() => {
+      document.dispatchEvent(new Event('visibilitychange'))
+    })
+    expect(saveSpy).not.toHaveBeenCalled()
+
+    visibility.mockReturnValue('hidden')
+    act(() => {
+      document.dispatchEvent(new Event('visibilitychange'))
+    })
+    expect(saveSpy).toHaveBeenCalledTimes(1)
+  })
+
+  it('flushes a pending save on unmount', () => {
+    const { result, unmount } = renderHook(() => useVrpMessages())
+
+    addBurst(result)
+    unmount()
+
+    expect(saveSpy).toHaveBeenCalledTimes(1)
+    expect(saveSpy.mock.calls[0][0]).toHaveLength(3)
+  })
+
+  it('drops the pending save when messages are cleared', () => {
+    const { result, unmount } = renderHook(() => useVrpMessages())
+
+    addBurst(result)
+    act(() => {
+      result.current.clearMessages()
+    })
+    act(() => {
+      jest.advanceTimersByTime(300)
+    })
+    unmount()
+
+    expect(saveSpy).not.toHaveBeenCalled()
+    expect(ChatPersistence.clearMessages).toHaveBeenCalledTimes(1)
+  })
+})
@@ -0,0 +1,166 @@
+import {
+  validateComplexity,
+  getComplexityErrorMessage,
+  estimateSolveTime,
+  DEMO_COMPLEXITY_LIMITS,
+  ComplexityLimits
+} from '@/lib/vrp-complexity-validator'
+import { Vrp } from 'solvice-vrp-solver/resources/vrp/vrp'
+
+const limits: ComplexityLimits = {
+  maxJobs: 10,
+  maxResources: 2,
+  maxTimeWindowsPerJob: 2,
+  maxBreaksPerResource: 1
+}
+
+function createJobs(count: number, windowsPerJob = 1): Vrp.Job[] {
+  return Array.from({ length: count }, (_, i) => ({
+    name: `job-${i}`,
+    windows: Array.from({ length: windowsPerJob }, () => ({
+      from: '2024-01-15T08:00:00Z',
+      to: '2024-01-15T17:00:00Z'
+    }))
+  })) as Vrp.Job[]
+}
+
+function createResources(count: number, breaksPerShift = 0): Vrp.Resource[] {
+  return Array.from({ length: count }, (_, i) => ({
+    name: `vehicle-${i}`,
+    shifts: [
+      {
+        from: '2024-01-15T08:00:00Z',
+        to: '2024-01-15T17:00:00Z',
+        breaks: Array.from({ length: breaksPerShift }, () => ({ type: 'WINDOWED' }))
+      }
+    ]
+  })) as unknown as Vrp.Resource[]
+}
+
+function createRequest(jobs: Vrp.Job[], resources: Vrp.Resource[]): Vrp.VrpSyncSolveParams {
+  return { jobs, resources } as Vrp.VrpSyncSolveParams
+}
+
+describe('VRP Complexity Validator', () => {
+  describe('validateComplexity', () => {
+    it('accepts problems within limits', () => {
+      const result = validateComplexity(createRequest(createJobs(3, 2), createResources(1, 1)), limits)
+
+      expect(result.valid).toBe(true)
+      expect(result.errors).toEqual([])
+      expect(result.actualComplexity).toEqual({
+        jobCount: 3,
+        resourceCount: 1,
+        maxTimeWindows: 2,
+        totalTimeWindows: 6
+      })
+    })
+
+    it('requires at least one job and one resource', () => {
+      const result = validateComplexity(createRequest([], []), limits)
+
+      expect(result.valid).toBe(false)
+      expect(result.errors).toContain('At least 1 job is required')
+      expect(result.errors).toContain('At least 1 vehicle/resource is required')
+    })
+
+    it('reports jobs with too many time windows', () => {
+      const jobs = createJobs(2)
+      jobs.push(...createJobs(1, 3).map(job => ({ ...job, name: 'busy-job' })))
+
+      const result = validateComplexity(createRequest(jobs, createResources(1)), limits)
+
+      expect(result.valid).toBe(false)
+      expect(result.errors).toEqual([
+        'Job "busy-job" has 3 time windows (maximum 2 for demo)'
+      ])
+      expect(result.actualComplexity.maxTimeWindows).toBe(3)
+      expect(result.actualComplexity.totalTimeWindows).toBe(5)
+    })
+
+    it('reports shifts with too many breaks', () => {
+      const result = validateComplexity(createRequest(createJobs(1), createResources(1, 2)), limits)
+
+      expect(result.valid).toBe(false)
+      expect(result.errors).toEqual([
+        'Resource "vehicle-0" shift 0 has 2 breaks (maximum 1 for demo)'
+      ])
+    })
+
+    it('stops after the headline error when there are too many jobs', () => {
+      const result = validateComplexity(createRequest(createJobs(50, 5), createResources(1, 3)), limits)
+
+      expect(result.valid).toBe(false)
+      expect(result.errors).toEqual([
+        'Too many jobs: 50 (maximum 10 for demo). Sign up for higher limits!'
+      ])
+      expect(result.actualComplexity).toEqual({
+        jobCount: 50,
+        resourceCount: 1
+      })
+    })
+
+    it('stops after the headline error when there are too many vehicles', () => {
+      const result = validateComplexity(createRequest(createJobs(1, 5), createResources(3, 3)), limits)
+
+      expect(result.valid).toBe(false)
+      expect(result.errors).toEqual([
+        'Too many vehicles: 3 (maximum 2 for demo). Sign up for higher limits!'
+      ])
+    })
+
+    it('still warns about the other limit when stopping early', () => {
+      const result = validateComplexity(createRequest(createJobs(50), createResources(2)), limits)
+
+      expect(result.valid).toBe(false)
+      expect(result.warnings).toContain('Approaching resource limit (2/2)')
+    })
+
+    it('warns when approaching limits', () => {
+      const result = validateComplexity(createRequest(createJobs(9), createResources(2)), limits)
+
+      expect(result.valid).toBe(true)
+      expect(result.warnings).toEqual([
+        'Approaching job limit (9/10)',
+        'Approaching resource limit (2/2)'
+      ])
+    })
+
+    it('uses demo limits by default', () => {
+      const result = validateComplexity(
+        createRequest(createJobs(DEMO_COMPLEXITY_LIMITS.maxJobs + 1), createResources(1))
+      )
+
+      expect(result.valid).toBe(false)
+      expect(result.errors[0]).toContain(`maximum ${DEMO_COMPLEXITY_LIMITS.maxJobs} for demo`)
+    })
+  })
+
+  describe('getComplexityErrorMessage', () => {
+    it('returns an empty string for valid results', () => {
+      const result = validateComplexity(createRequest(createJobs(1), createResources(1)), limits)
+
+      expect(getComplexityErrorMessage(result)).toBe('')
+    })
+
+    it('numbers each error', () => {
+      const result = validateComplexity(createRequest([], []), limits)
+      const message = getComplexityErrorMessage(result)
+
+      expect(message).toContain('1. At least 1 job is required')
+      expect(message).toContain('2. At least 1 vehicle/resource is required')
+    })
+  })
+
+  describe('estimateSolveTime', () => {
+    it('estimates from the job and resource counts', () => {
+      const request = createRequest(createJobs(10), createResources(2))
+
+      expect(estimateSolveTime(request)).toBeCloseTo(2 + 10 * 0.1 + 2 * 0.5)
+    })
+
+    it('treats missing jobs and resources as empty', () => {
+      expect(estimateSolveTime({} as Vrp.VrpSyncSolveParams)).toBe(2)
+    })
+  })
+})
@@ -0,0 +1,61 @@
+/**
+ * @jest-environment node
+ */
+
+import { NextRequest } from 'next/server'
+import { middleware } from '../middleware'
+import { MAX_REQUEST_SIZE } from '@/lib/request-body'
+
+function createApiRequest(headers: Record<string, string>, body = '{}'): NextRequest {
+  return new NextRequest('http://localhost/api/vrp/solve', {
+    method: 'POST',
+    headers,
+    body
+  })
+}
+
+describe('middleware', () => {
+  beforeEach(() => {
+    jest.spyOn(console, 'warn').mockImplementation(() => {})
+  })
+
+  afterEach(() => {
+    jest.restoreAllMocks()
+  })
+
+  it('passes through requests within the size limit', () => {
+    const response = middleware(createApiRequest({
+      'content-type': 'application/json',
+      'content-length': '2'
+    }))
+
+    expect(response.headers.get('x-middleware-next')).toBe('1')
+  })
+
+  it('passes through requests without a Content-Length header', () => {
+    // Chunked bodies are size-checked by readJsonBody in the route handlers
+    const request = createApiRequest({ 'content-type': 'application/json' })
+    expect(request.headers.get('content-length')).toBeNull()
+
+    const response = middleware(request)
+
+    expect(response.status).not.toBe(411)
+    expect(response.headers.get('x-middleware-next')).toBe('1')
+  })
+
+  it('rejects requests declaring a body over the size limit', async () => {
+    const size = MAX_REQUEST_SIZE + 1
+    const response = middleware(createApiRequest({
+      'content-type': 'application/json',
+      'content-length': String(size)
+    }))
+
+    expect(response.status).toBe(413)
+    const body = await response.json()
+    expect(body).toMatchObject({
+      type: 'payload_too_large',
+      maxSize: MAX_REQUEST_SIZE,
+      actualSize: size
+    })
+  })
+})
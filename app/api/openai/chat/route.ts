@@ -2,8 +2,17 @@ import { NextRequest, NextResponse } from 'next/server'
 import OpenAI from 'openai'
 import { rateLimiters, createRateLimitHeaders } from '@/lib/rate-limiter'
 import { costGuardian } from '@/lib/cost-guardian'
+import { readJsonBody, PayloadTooLargeError, payloadTooLargeResponse } from '@/lib/request-body'
+
+// Model pricing per million tokens (input/output)
+const MODEL_PRICING = {
+  'gpt-4o': { input: 2.50, output: 10.00 },
+  'gpt-4o-mini': { input: 0.15, output: 0.60 },
+}
 
 export async function POST(request: NextRequest) {
+  let reservedCost = 0
+
   try {
     // Apply rate limiting - 10 requests per 10 minutes
     const rateLimitResult = rateLimiters.openai(request)
@@ -26,7 +35,6 @@ export async function POST(request: NextRequest) {
 
     if (!apiKey) {
       console.error('❌ OpenAI API key not found in environment variables')
-      console.error('Available env vars:', Object.keys(process.env).filter(key => key.includes('OPENAI')))
       return NextResponse.json(
         { error: 'OpenAI API key not configured on server' },
         { status: 500 }
@@ -34,12 +42,20 @@ export async function POST(request: NextRequest) {
     }
 
     // Parse request body
-    const { messages, model = 'gpt-4o', max_tokens = 2000, temperature = 0.3, response_format } = await request.json()
+    const { messages, model = 'gpt-4o', max_tokens = 2000, temperature = 0.3, response_format } = await readJsonBody(request)
 
-    // Check daily budget before making expensive OpenAI call
+    if (!messages || !Array.isArray(messages)) {
+      return NextResponse.json(
+        { error: 'Invalid request: messages array is required' },
+        { status: 400 }
+      )
+    }
+
+    // Reserve daily budget before making expensive OpenAI call, so
+    // concurrent requests see each other's in-flight spend
     // Conservative estimate: ~$0.05 for gpt-4o request
     const estimatedCost = model === 'gpt-4o' ? 0.05 : 0.01
-    const budgetCheck = costGuardian.checkBudget(estimatedCost)
+    const budgetCheck = costGuardian.reserveBudget(estimatedCost)
 
     if (!budgetCheck.allowed) {
       return NextResponse.json(
@@ -52,13 +68,7 @@ export async function POST(request: NextRequest) {
         { status: 429 }
       )
     }
-
-    if (!messages || !Array.isArray(messages)) {
-      return NextResponse.json(
-        { error: 'Invalid request: messages array is required' },
-        { status: 400 }
-      )
-    }
+    reservedCost = estimatedCost
 
     // Initialize OpenAI client on server-side
     const openai = new OpenAI({
@@ -84,11 +94,6 @@ export async function POST(request: NextRequest) {
 
     // Record actual cost after successful call
     if (completion.usage) {
-      const MODEL_PRICING = {
-        'gpt-4o': { input: 2.50, output: 10.00 },
-        'gpt-4o-mini': { input: 0.15, output: 0.60 },
-      };
-
       const pricing = MODEL_PRICING[model as keyof typeof MODEL_PRICING] || MODEL_PRICING['gpt-4o'];
       const actualCost = (
         (completion.usage.prompt_tokens * pricing.input / 1_000_000) +
@@ -114,6 +119,10 @@ export async function POST(request: NextRequest) {
   } catch (error: unknown) {
     console.error('OpenAI API Error:', error)
 
+    if (error instanceof PayloadTooLargeError) {
+      return payloadTooLargeResponse()
+    }
+
     // Handle different error types
     if (error instanceof OpenAI.APIError) {
       return NextResponse.json(
@@ -154,6 +163,11 @@ export async function POST(request: NextRequest) {
       { error: 'Internal server error', type: 'server' },
       { status: 500 }
     )
+  } finally {
+    // The actual cost (if any) has been recorded by now
+    if (reservedCost > 0) {
+      costGuardian.releaseBudget(reservedCost)
+    }
   }
 }
 
@@ -1,6 +1,7 @@
 import { NextRequest, NextResponse } from 'next/server'
 import OpenAI from 'openai'
 import { rateLimiters, createRateLimitHeaders } from '@/lib/rate-limiter'
+import { readJsonBody, PayloadTooLargeError, payloadTooLargeResponse } from '@/lib/request-body'
 
 export async function POST(request: NextRequest) {
   try {
@@ -33,7 +34,7 @@ export async function POST(request: NextRequest) {
     }
 
     // Parse request body
-    const { csvContent, filename, files, instructions } = await request.json()
+    const { csvContent, filename, files, instructions } = await readJsonBody(request)
 
     // Handle both single file (csvContent + filename) and multiple files (files array)
     const filesToProcess = files || (
@@ -223,8 +224,21 @@ Please show your work step by step for each file and provide the final merged JS
 
     console.log('✅ Run completed successfully')
 
-    // Step 6: Retrieve the messages
-    const messages = await openai.beta.threads.messages.list(thread.id)
+    // Step 6: Retrieve the messages, fetching execution metadata for lazy
+    // loading alongside them rather than after cleanup
+    const [messages, stepCount] = await Promise.all([
+      openai.beta.threads.messages.list(thread.id),
+      openai.beta.threads.runs.steps.list(run.id, {
+        thread_id: thread.id,
+        limit: 10
+      }).then(steps => {
+        console.log(`📊 Found ${steps.data.length} execution steps for lazy loading`)
+        return steps.data.length
+      }).catch(stepError => {
+        console.warn('⚠️ Could not fetch step count:', stepError)
+        return 0
+      })
+    ])
     const assistantMessage = messages.data.find(msg => msg.role === 'assistant')
 
     if (!assistantMessage || !assistantMessage.content[0]) {
@@ -244,13 +258,15 @@ Please show your work step by step for each file and provide the final merged JS
 
     // Step 7: Clean up resources
     try {
-      // Delete all uploaded files
-      await Promise.all(uploadedFiles.map(file =>
-        openai.files.delete(file.id).catch(err =>
-          console.warn(`⚠️ Failed to delete file ${file.id}:`, err)
-        )
-      ))
-      await openai.beta.assistants.delete(assistant.id)
+      // Delete all uploaded files and the assistant concurrently
+      await Promise.all([
+        ...uploadedFiles.map(file =>
+          openai.files.delete(file.id).catch(err =>
+            console.warn(`⚠️ Failed to delete file ${file.id}:`, err)
+          )
+        ),
+        openai.beta.assistants.delete(assistant.id)
+      ])
       console.log('🧹 Cleanup completed for all files')
     } catch (cleanupError) {
       console.warn('⚠️ Cleanup warning:', cleanupError)
@@ -275,19 +291,6 @@ Please show your work step by step for each file and provide the final merged JS
       throw new Error('Failed to parse VRP JSON from Code Interpreter response')
     }
 
-    // Fetch execution metadata for lazy loading
-    let stepCount = 0
-    try {
-      const steps = await openai.beta.threads.runs.steps.list(run.id, {
-        thread_id: thread.id,
-        limit: 10
-      })
-      stepCount = steps.data.length
-      console.log(`📊 Found ${stepCount} execution steps for lazy loading`)
-    } catch (stepError) {
-      console.warn('⚠️ Could not fetch step count:', stepError)
-    }
-
     return NextResponse.json({
       success: true,
       result: vrpResult,
@@ -308,6 +311,10 @@ Please show your work step by step for each file and provide the final merged JS
   } catch (error: unknown) {
     console.error('Code Interpreter API Error:', error)
 
+    if (error instanceof PayloadTooLargeError) {
+      return payloadTooLargeResponse()
+    }
+
     // Handle different error types
     if (error instanceof OpenAI.APIError) {
       return NextResponse.json(
@@ -1,5 +1,6 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { SolviceVrpSolver } from 'solvice-vrp-solver'
+import { getSolviceClient } from '@/lib/solvice-client'
 import { rateLimiters, createRateLimitHeaders } from '@/lib/rate-limiter'
 
 export async function GET(
@@ -38,10 +39,8 @@ export async function GET(
 
     const { id } = await params
 
-    // Initialize Solvice client
-    const client = new SolviceVrpSolver({
-      apiKey: apiKey
-    })
+    // Reuse the cached Solvice client for this API key
+    const client = getSolviceClient(apiKey)
 
     // Get the explanation for the job
     const response = await client.vrp.jobs.explanation(id)
@@ -53,16 +52,21 @@ export async function GET(
   } catch (error: unknown) {
     console.error('VRP Explanation API Error:', error)
 
-    // Handle different error types
+    // Handle different error types, checking SDK error classes before
+    // falling back to message matching for anything else
     const errorMessage = error instanceof Error ? error.message : String(error)
-    if (errorMessage?.includes('unauthorized') || errorMessage?.includes('authentication')) {
+    if (
+      error instanceof SolviceVrpSolver.AuthenticationError ||
+      errorMessage?.includes('unauthorized') ||
+      errorMessage?.includes('authentication')
+    ) {
       return NextResponse.json(
         { error: 'Invalid API key', type: 'authentication' },
         { status: 401 }
       )
     }
 
-    if (errorMessage?.includes('not found')) {
+    if (error instanceof SolviceVrpSolver.NotFoundError || errorMessage?.includes('not found')) {
       return NextResponse.json(
         { error: 'Job not found', type: 'validation' },
         { status: 404 }
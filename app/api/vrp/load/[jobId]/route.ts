@@ -1,6 +1,42 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { rateLimiters, createRateLimitHeaders } from '@/lib/rate-limiter'
-import { SolviceVrpSolver } from 'solvice-vrp-solver'
+import { getSolviceClient } from '@/lib/solvice-client'
+import { createETag, matchesETag } from '@/lib/etag'
+
+const UUID_REGEX = /^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$/i
+
+/**
+ * Upstream returned a body that can't be spliced into our JSON response
+ */
+class UpstreamFormatError extends Error {
+  constructor(message: string) {
+    super(message)
+    this.name = 'UpstreamFormatError'
+  }
+}
+
+/**
+ * Read an upstream response body as JSON text, treating an empty body as null.
+ * Non-JSON or malformed bodies (e.g. proxy error pages, truncated responses)
+ * throw UpstreamFormatError so they are never spliced into the response.
+ */
+async function readJsonText(response: Response): Promise<string> {
+  const text = await response.text()
+  if (text.trim() === '') return 'null'
+
+  const contentType = response.headers.get('content-type') ?? ''
+  if (!contentType.includes('json')) {
+    throw new UpstreamFormatError(`Unexpected upstream content type: ${contentType || 'none'}`)
+  }
+
+  try {
+    JSON.parse(text)
+  } catch {
+    throw new UpstreamFormatError('Malformed upstream JSON')
+  }
+
+  return text
+}
 
 export async function GET(
   request: NextRequest,
@@ -38,28 +74,36 @@ export async function GET(
     const { jobId } = await params
 
     // Validate UUID format
-    const uuidRegex = /^[0-9a-f]{8}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{4}-?[0-9a-f]{12}$/i
-    if (!uuidRegex.test(jobId)) {
+    if (!UUID_REGEX.test(jobId)) {
       return NextResponse.json(
         { error: 'Invalid job ID format' },
         { status: 400 }
       )
     }
 
-    // Initialize SDK client
-    const client = new SolviceVrpSolver({ apiKey: apiKey })
+    // Reuse the cached Solvice client for this API key
+    const client = getSolviceClient(apiKey)
 
-    // Fetch request, solution, and explanation simultaneously using SDK
+    // Fetch request, solution, and explanation simultaneously using SDK.
+    // Bodies are only parsed to validate them, then kept as raw JSON text and
+    // spliced into the response below, so large solutions are never
+    // re-serialized by this route.
     const [requestResponse, solutionResponse, explanationResponse] = await Promise.allSettled([
-      client.vrp.jobs.retrieve(jobId),
-      client.vrp.jobs.solution(jobId),
-      client.vrp.jobs.explanation(jobId)
+      client.vrp.jobs.retrieve(jobId).asResponse().then(readJsonText),
+      client.vrp.jobs.solution(jobId).asResponse().then(readJsonText),
+      client.vrp.jobs.explanation(jobId).asResponse().then(readJsonText)
     ])
 
     // Handle request fetch result
-    let requestData = null
+    let requestData: string
     if (requestResponse.status === 'fulfilled') {
       requestData = requestResponse.value
+    } else if (requestResponse.reason instanceof UpstreamFormatError) {
+      console.error('Job loading error:', requestResponse.reason)
+      return NextResponse.json(
+        { error: 'Invalid response from VRP API' },
+        { status: 502 }
+      )
     } else {
       return NextResponse.json(
         { error: 'Job not found' },
@@ -68,7 +112,7 @@ export async function GET(
     }
 
     // Handle solution fetch result (may not exist yet)
-    let solutionData = null
+    let solutionData: string | null = null
     let solutionError = null
 
     if (solutionResponse.status === 'fulfilled') {
@@ -84,7 +128,7 @@ export async function GET(
     }
 
     // Handle explanation fetch result (may not exist yet)
-    let explanationData = null
+    let explanationData: string | null = null
     let explanationError = null
 
     if (explanationResponse.status === 'fulfilled') {
@@ -99,14 +143,36 @@ export async function GET(
       }
     }
 
-    return NextResponse.json({
-      request: requestData,
-      solution: solutionData,
-      solutionError,
-      explanation: explanationData,
-      explanationError
-    }, {
-      headers: createRateLimitHeaders(rateLimitResult)
+    const body =
+      `{"request":${requestData}` +
+      `,"solution":${solutionData ?? 'null'}` +
+      `,"solutionError":${JSON.stringify(solutionError)}` +
+      `,"explanation":${explanationData ?? 'null'}` +
+      `,"explanationError":${JSON.stringify(explanationError)}}`
+
+    // Clients polling for a solution or explanation get a bodiless 304
+    // until something actually changes
+    const etag = createETag(body)
+
+    if (matchesETag(request.headers.get('if-none-match'), etag)) {
+      return new NextResponse(null, {
+        status: 304,
+        headers: {
+          ETag: etag,
+          'Cache-Control': 'private, no-cache',
+          ...createRateLimitHeaders(rateLimitResult)
+        }
+      })
+    }
+
+    return new NextResponse(body, {
+      headers: {
+        'Content-Type': 'application/json',
+        ETag: etag,
+        // Responses depend on the caller's API key; always revalidate
+        'Cache-Control': 'private, no-cache',
+        ...createRateLimitHeaders(rateLimitResult)
+      }
     })
 
   } catch (error) {
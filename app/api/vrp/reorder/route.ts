@@ -1,5 +1,10 @@
 import { NextRequest, NextResponse } from "next/server";
 import { Vrp } from "solvice-vrp-solver/resources/vrp/vrp";
+import {
+  readJsonBody,
+  PayloadTooLargeError,
+  payloadTooLargeResponse,
+} from "@/lib/request-body";
 
 interface ReorderRequest {
   jobId: string; // Job being moved
@@ -30,7 +35,7 @@ export async function POST(request: NextRequest) {
       );
     }
 
-    const body: ReorderRequest = await request.json();
+    const body = await readJsonBody<ReorderRequest>(request);
     const { jobId, afterJobId, operation, originalSolutionId } = body;
 
     // Construct change specification for Solvice Change API
@@ -92,6 +97,10 @@ export async function POST(request: NextRequest) {
   } catch (error) {
     console.error("VRP reorder error:", error);
 
+    if (error instanceof PayloadTooLargeError) {
+      return payloadTooLargeResponse();
+    }
+
     return NextResponse.json(
       {
         error:
@@ -103,29 +112,50 @@ export async function POST(request: NextRequest) {
   }
 }
 
-function extractFeasibilityWarnings(solution: Vrp.OnRouteResponse): string[] {
+// Optional fields the Change API may add on top of the SDK response types.
+// Note: The actual field names may differ - check Solvice API docs
+interface VisitViolationFields {
+  violatedConstraints?: string[];
+  violations?: string[];
+}
+
+interface SolutionUnassignedFields {
+  unassigned?: unknown[];
+}
+
+type ChangeApiVisit = NonNullable<
+  NonNullable<Vrp.OnRouteResponse["trips"]>[number]["visits"]
+>[number] &
+  VisitViolationFields;
+
+type ChangeApiSolution = Vrp.OnRouteResponse & SolutionUnassignedFields;
+
+// Upper bound on per-visit violation warnings returned to the client
+const MAX_FEASIBILITY_WARNINGS = 100;
+
+function extractFeasibilityWarnings(solution: ChangeApiSolution): string[] {
   const warnings: string[] = [];
 
-  // Check for constraint violations in solution
-  solution.trips?.forEach((trip) => {
-    trip.visits?.forEach((visit) => {
-      // Note: The actual field name may differ - check Solvice API docs
-      const visitAny = visit as Record<string, unknown>;
-      const violations =
-        (visitAny.violatedConstraints as string[]) ||
-        (visitAny.violations as string[]) ||
-        [];
-      if (violations.length > 0) {
+  // Check for constraint violations in solution, stopping once the cap is hit
+  // so large infeasible solutions don't build warnings nobody will read
+  collectViolations: for (const trip of solution.trips ?? []) {
+    for (const visit of trip.visits ?? []) {
+      const { violatedConstraints, violations: visitViolations } =
+        visit as ChangeApiVisit;
+      const violations = violatedConstraints || visitViolations;
+      if (violations && violations.length > 0) {
         warnings.push(`Job ${visit.job}: ${violations.join(", ")}`);
+        if (warnings.length >= MAX_FEASIBILITY_WARNINGS) {
+          break collectViolations;
+        }
       }
-    });
-  });
+    }
+  }
 
   // Check for unassigned jobs
-  const solutionAny = solution as unknown as Record<string, unknown>;
-  const unassigned = (solutionAny.unassigned as unknown[]) || [];
-  if (unassigned.length > 0) {
-    warnings.push(`${unassigned.length} unassigned jobs`);
+  const unassignedCount = solution.unassigned?.length ?? 0;
+  if (unassignedCount > 0) {
+    warnings.push(`${unassignedCount} unassigned jobs`);
   }
 
   return warnings;
@@ -1,9 +1,11 @@
 import { NextRequest, NextResponse } from 'next/server'
 import { SolviceVrpSolver } from 'solvice-vrp-solver'
+import { getSolviceClient } from '@/lib/solvice-client'
 import { Vrp } from 'solvice-vrp-solver/resources/vrp/vrp'
 import { rateLimiters, createRateLimitHeaders } from '@/lib/rate-limiter'
 import { validateComplexity, getComplexityErrorMessage } from '@/lib/vrp-complexity-validator'
 import { sanitizeVrpInput } from '@/lib/input-sanitizer'
+import { readJsonBody, PayloadTooLargeError, payloadTooLargeResponse } from '@/lib/request-body'
 
 export async function POST(request: NextRequest) {
   try {
@@ -29,8 +31,6 @@ export async function POST(request: NextRequest) {
 
     if (!apiKey) {
       console.error('❌ Solvice API key not found in environment variables or headers')
-      console.error('Available env vars:', Object.keys(process.env).filter(key => key.includes('SOLVICE')))
-      console.error('Has auth header:', !!authHeader)
       return NextResponse.json(
         { error: 'No API key provided' },
         { status: 401 }
@@ -38,7 +38,7 @@ export async function POST(request: NextRequest) {
     }
 
     // Parse request body
-    const rawRequestData: Vrp.VrpSyncSolveParams = await request.json()
+    const rawRequestData = await readJsonBody<Vrp.VrpSyncSolveParams>(request)
 
     // Sanitize input to prevent injection attacks
     const sanitizationResult = sanitizeVrpInput(rawRequestData)
@@ -91,38 +91,56 @@ export async function POST(request: NextRequest) {
       console.warn('⚠️  VRP complexity warnings:', complexityCheck.warnings)
     }
 
-    // Initialize Solvice client
-    const client = new SolviceVrpSolver({
-      apiKey: apiKey
-    })
+    // Reuse the cached Solvice client for this API key
+    const client = getSolviceClient(apiKey)
 
-    // Make the VRP solve request
-    const response = await client.vrp.syncSolve(requestData)
+    // Make the VRP solve request. The solution is passed through as the raw
+    // upstream body so large responses stream to the client instead of being
+    // parsed and re-serialized here.
+    const response = await client.vrp.syncSolve(requestData).asResponse()
 
-    return NextResponse.json(response, {
-      headers: createRateLimitHeaders(rateLimitResult)
+    return new NextResponse(response.body, {
+      status: response.status,
+      headers: {
+        'Content-Type': response.headers.get('content-type') || 'application/json',
+        ...createRateLimitHeaders(rateLimitResult)
+      }
     })
 
   } catch (error: unknown) {
     console.error('VRP API Error:', error)
 
-    // Handle different error types
+    if (error instanceof PayloadTooLargeError) {
+      return payloadTooLargeResponse()
+    }
+
+    // Handle different error types, checking SDK error classes before
+    // falling back to message matching for anything else
     const errorMessage = error instanceof Error ? error.message : String(error)
-    if (errorMessage?.includes('unauthorized') || errorMessage?.includes('authentication')) {
+    if (
+      error instanceof SolviceVrpSolver.AuthenticationError ||
+      errorMessage?.includes('unauthorized') ||
+      errorMessage?.includes('authentication')
+    ) {
       return NextResponse.json(
         { error: 'Invalid API key', type: 'authentication' },
         { status: 401 }
       )
     }
 
-    if (errorMessage?.includes('validation') || errorMessage?.includes('invalid')) {
+    if (
+      error instanceof SolviceVrpSolver.BadRequestError ||
+      error instanceof SolviceVrpSolver.UnprocessableEntityError ||
+      errorMessage?.includes('validation') ||
+      errorMessage?.includes('invalid')
+    ) {
       return NextResponse.json(
         { error: 'Invalid request data', type: 'validation' },
         { status: 400 }
       )
     }
 
-    if (errorMessage?.includes('timeout')) {
+    if (error instanceof SolviceVrpSolver.APIConnectionTimeoutError || errorMessage?.includes('timeout')) {
       return NextResponse.json(
         { error: 'Request timeout', type: 'timeout' },
         { status: 408 }
@@ -2,14 +2,20 @@ import { Message } from '@/components/ui/chat-message'
 
 const STORAGE_KEY = 'vrp-assistant-chat-history'
 const TIMESTAMP_KEY = 'vrp-assistant-chat-timestamp'
+// Only the most recent messages are kept so long sessions don't grow
+// storage (and the parse on every load) without bound
+const MAX_PERSISTED_MESSAGES = 200
 
 export class ChatPersistence {
   /**
-   * Save chat messages to localStorage with current date
+   * Save the most recent chat messages to localStorage with current date
    */
   static saveMessages(messages: Message[]): void {
     try {
-      const serializedMessages = JSON.stringify(messages)
+      const recentMessages = messages.length > MAX_PERSISTED_MESSAGES
+        ? messages.slice(-MAX_PERSISTED_MESSAGES)
+        : messages
+      const serializedMessages = JSON.stringify(recentMessages)
       const today = new Date().toDateString()
       localStorage.setItem(STORAGE_KEY, serializedMessages)
       localStorage.setItem(TIMESTAMP_KEY, today)
@@ -1,13 +1,27 @@
 'use client'
 
 import { useState, useEffect } from 'react'
-import { MessageCircle, Pencil, BarChart3, FileJson } from 'lucide-react'
+import dynamic from 'next/dynamic'
+import { MessageCircle, Pencil, BarChart3, FileJson, Loader2 } from 'lucide-react'
 import { Sheet, SheetContent, SheetHeader, SheetTitle, SheetDescription, SheetTrigger } from '@/components/ui/sheet'
 import { Button } from '@/components/ui/button'
 import { Badge } from '@/components/ui/badge'
-import { VrpAssistantPane } from './VrpAssistantPane'
 import { useVrpAssistant } from './VrpAssistantContext'
 
+// The chat UI (markdown rendering, file/audio input) is only needed once the
+// panel is opened, so keep it out of the initial bundle
+const VrpAssistantPane = dynamic(
+  () => import('./VrpAssistantPane').then(mod => mod.VrpAssistantPane),
+  {
+    ssr: false,
+    loading: () => (
+      <div className="flex h-full items-center justify-center" data-testid="vrp-assistant-pane-loading">
+        <Loader2 className="h-5 w-5 animate-spin text-muted-foreground" />
+      </div>
+    )
+  }
+)
+
 export function VrpAssistantContainer() {
   const { messages, isOpen, chatMode, toggleAssistant, closeAssistant } = useVrpAssistant()
   const [isMobile, setIsMobile] = useState(false)
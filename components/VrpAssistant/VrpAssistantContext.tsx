@@ -1,6 +1,6 @@
 'use client'
 
-import { createContext, useContext, useState, useCallback, useEffect, ReactNode } from 'react'
+import { createContext, useContext, useState, useCallback, useEffect, useRef, ReactNode } from 'react'
 import { Message, ExecutionMetadata } from '@/components/ui/chat-message'
 import { OpenAIService, type CsvToVrpResponse } from '@/lib/openai-service'
 import { Vrp } from 'solvice-vrp-solver/resources/vrp/vrp'
@@ -49,7 +49,7 @@ export function VrpAssistantProvider({ children }: VrpAssistantProviderProps) {
   const [input, setInput] = useState('')
   const [isOpen, setIsOpen] = useState(false)
   const [chatMode, setChatModeState] = useState<ChatMode>('modify')
-  const [openAIService] = useState<OpenAIService | null>(null)
+  const openAIServiceRef = useRef<OpenAIService | null>(null)
   const [onVrpDataUpdate, setOnVrpDataUpdateState] = useState<((data: Vrp.VrpSyncSolveParams) => void) | undefined>()
 
   const setProcessing = (processing: boolean) => {
@@ -64,6 +64,19 @@ export function VrpAssistantProvider({ children }: VrpAssistantProviderProps) {
     setOnVrpDataUpdateState(() => callback)
   }, [])
 
+  // Create the OpenAI service once and reuse it for every request
+  const getAiService = (): OpenAIService | null => {
+    if (!openAIServiceRef.current) {
+      try {
+        openAIServiceRef.current = new OpenAIService()
+      } catch {
+        addMessage('assistant', 'OpenAI service is not configured. Please check your API key configuration.')
+        return null
+      }
+    }
+    return openAIServiceRef.current
+  }
+
   const handleInputChange = (e: React.ChangeEvent<HTMLTextAreaElement>) => {
     setInput(e.target.value)
   }
@@ -90,16 +103,8 @@ export function VrpAssistantProvider({ children }: VrpAssistantProviderProps) {
         return
       }
 
-      // Create OpenAI service lazily
-      let aiService = openAIService
-      if (!aiService) {
-        try {
-          aiService = new OpenAIService()
-        } catch {
-          addMessage('assistant', 'OpenAI service is not configured. Please check your API key configuration.')
-          return
-        }
-      }
+      const aiService = getAiService()
+      if (!aiService) return
 
       // Route to different handlers based on mode
       switch (chatMode) {
@@ -212,16 +217,8 @@ export function VrpAssistantProvider({ children }: VrpAssistantProviderProps) {
       // Add user message
       addMessage('user', `📎 Uploaded CSV file: ${filename}`)
 
-      // Create OpenAI service lazily
-      let aiService = openAIService
-      if (!aiService) {
-        try {
-          aiService = new OpenAIService()
-        } catch {
-          addMessage('assistant', 'OpenAI service is not configured. Please check your API key configuration.')
-          return
-        }
-      }
+      const aiService = getAiService()
+      if (!aiService) return
 
       // Convert CSV to VRP using Code Interpreter first, fallback to traditional method
       let conversionResult
@@ -252,16 +249,8 @@ export function VrpAssistantProvider({ children }: VrpAssistantProviderProps) {
       const fileNames = files.map(f => f.name).join(', ')
       addMessage('user', `📎 Uploaded ${files.length} CSV files: ${fileNames}`)
 
-      // Create OpenAI service lazily
-      let aiService = openAIService
-      if (!aiService) {
-        try {
-          aiService = new OpenAIService()
-        } catch {
-          addMessage('assistant', 'OpenAI service is not configured. Please check your API key configuration.')
-          return
-        }
-      }
+      const aiService = getAiService()
+      if (!aiService) return
 
       // Convert multiple CSVs to VRP using Code Interpreter (no fallback for multi-file)
       addMessage('system', `🤖 Using OpenAI Code Interpreter to process and merge ${files.length} CSV files...`)
@@ -130,13 +130,6 @@ export function VrpExplorer({ enableAiAssistant = true }: VrpExplorerProps) {
       toast.dismiss(toastId)
       toast.success('VRP problem solved successfully!')
 
-      console.log('🚀 VRP API Response received:', result)
-      console.log('🚀 Response trips:', result.trips)
-      if (result.trips?.[0]) {
-        console.log('🚀 First trip:', result.trips[0])
-        console.log('🚀 First trip polyline:', result.trips[0].polyline)
-      }
-
       setVrpResponse(prev => ({ ...prev, data: result }))
     } catch (error) {
       toast.dismiss()
@@ -189,12 +182,6 @@ export function VrpExplorer({ enableAiAssistant = true }: VrpExplorerProps) {
 
   // Handle request data changes
   const handleRequestChange = useCallback((newRequestData: Record<string, unknown>) => {
-    console.log('🗺️ VrpExplorer: Request data changed, updating map...', {
-      hasJobs: Array.isArray((newRequestData as Record<string, unknown>)?.jobs),
-      jobCount: Array.isArray((newRequestData as Record<string, unknown>)?.jobs) ? ((newRequestData as Record<string, unknown>).jobs as unknown[]).length : 0,
-      hasResources: Array.isArray((newRequestData as Record<string, unknown>)?.resources),
-      resourceCount: Array.isArray((newRequestData as Record<string, unknown>)?.resources) ? ((newRequestData as Record<string, unknown>).resources as unknown[]).length : 0
-    })
     setVrpRequest(prev => ({ ...prev, data: newRequestData as unknown as Vrp.VrpSyncSolveParams }))
     // Clear response when request changes
     setVrpResponse(prev => ({ ...prev, data: null }))
@@ -212,46 +199,42 @@ export function VrpExplorer({ enableAiAssistant = true }: VrpExplorerProps) {
     setVrpResponse(prev => ({ ...prev, data: null }))
   }, [])
 
-  // Handle job loading
+  // Handle job loading (errors propagate to the dialog for display)
   const handleLoadJob = useCallback(async (jobId: string) => {
-    try {
-      const response = await fetch(`/api/vrp/load/${jobId}`)
+    const response = await fetch(`/api/vrp/load/${jobId}`)
 
-      if (!response.ok) {
-        const errorData = await response.json()
-        throw new Error(errorData.error || 'Failed to load job')
-      }
+    if (!response.ok) {
+      const errorData = await response.json()
+      throw new Error(errorData.error || 'Failed to load job')
+    }
 
-      const result = await response.json()
+    const result = await response.json()
 
-      // Replace request data
-      if (result.request) {
-        setVrpRequest(prev => ({ ...prev, data: result.request }))
-        setVrpResponse(prev => ({ ...prev, data: null, explanation: null })) // Clear any existing solution and explanation
-      }
+    // Replace request data
+    if (result.request) {
+      setVrpRequest(prev => ({ ...prev, data: result.request }))
+      setVrpResponse(prev => ({ ...prev, data: null, explanation: null })) // Clear any existing solution and explanation
+    }
 
-      // Load solution if available
-      if (result.solution) {
-        setVrpResponse(prev => ({ ...prev, data: result.solution }))
-      } else if (result.solutionError) {
-        toast.info(result.solutionError)
-      }
+    // Load solution if available
+    if (result.solution) {
+      setVrpResponse(prev => ({ ...prev, data: result.solution }))
+    } else if (result.solutionError) {
+      toast.info(result.solutionError)
+    }
 
-      // Load explanation if available
-      if (result.explanation) {
-        setVrpResponse(prev => ({ ...prev, explanation: result.explanation }))
-      } else if (result.explanationError) {
-        console.info('Explanation:', result.explanationError)
-      }
+    // Load explanation if available
+    if (result.explanation) {
+      setVrpResponse(prev => ({ ...prev, explanation: result.explanation }))
+    } else if (result.explanationError) {
+      console.info('Explanation:', result.explanationError)
+    }
 
-      // Update URL and state
-      setJobState({ loadedJobId: jobId })
-      router.push(`/?run=${jobId}`, { scroll: false })
+    // Update URL and state
+    setJobState({ loadedJobId: jobId })
+    router.push(`/?run=${jobId}`, { scroll: false })
 
-      toast.success('Job loaded successfully!')
-    } catch (error) {
-      throw error // Re-throw for dialog error handling
-    }
+    toast.success('Job loaded successfully!')
   }, [router])
 
   // Handle clearing loaded job
@@ -40,6 +40,23 @@ import { LoadJobButton } from "@/components/LoadJobButton";
 import { LoadJobDialog } from "@/components/LoadJobDialog";
 import { JobBadge } from "@/components/JobBadge";
 
+// The VRP JSON Schema is static, so fetch it once per page load and share it
+// across editor mounts
+let vrpSchemaPromise: Promise<unknown> | null = null;
+
+function loadVrpSchema(): Promise<unknown> {
+  if (!vrpSchemaPromise) {
+    vrpSchemaPromise = fetch("/schemas/vrp-request.schema.json")
+      .then((response) => response.json())
+      .catch((error) => {
+        // Allow a later mount to retry after a failed fetch
+        vrpSchemaPromise = null;
+        throw error;
+      });
+  }
+  return vrpSchemaPromise;
+}
+
 // Helper function to find differences between old and new JSON and highlight them
 function highlightChangesAndScroll(
   editor: editor.IStandaloneCodeEditor,
@@ -70,11 +87,6 @@ function highlightChangesAndScroll(
 
     if (changedLines.length === 0) return;
 
-    console.log(
-      `🎨 Highlighting ${changedLines.length} changed lines:`,
-      changedLines,
-    );
-
     // Create decorations for changed lines
     const decorations = changedLines.map((lineNumber) => {
       const isNewLine = addedLines.includes(lineNumber);
@@ -106,7 +118,6 @@ function highlightChangesAndScroll(
 
     // Scroll to the first changed line with smooth animation
     const firstChangedLine = Math.min(...changedLines);
-    console.log(`📍 Scrolling to line ${firstChangedLine}`);
 
     // Use revealLineInCenter with smooth scrolling
     editor.revealLineInCenter(firstChangedLine, 1); // 1 = smooth scrolling
@@ -221,6 +232,9 @@ function VrpJsonEditorContent({
   );
   const [parseError, setParseError] = useState<string | null>(null);
   const editorRef = useRef<editor.IStandaloneCodeEditor | null>(null);
+  // Last object passed through validateData, so data echoed back from the
+  // parent after an edit is not validated a second time
+  const lastValidatedRef = useRef<Record<string, unknown> | null>(null);
 
   // Job loading dialog state
   const [isLoadJobDialogOpen, setIsLoadJobDialogOpen] = useState(false);
@@ -256,6 +270,7 @@ function VrpJsonEditorContent({
   // Validate data and notify parent
   const validateData = useCallback(
     (data: Record<string, unknown>) => {
+      lastValidatedRef.current = data;
       const result = validateVrpRequest(data);
       setValidationResult(result);
       onValidationChange(result);
@@ -263,15 +278,19 @@ function VrpJsonEditorContent({
     [onValidationChange],
   );
 
-  // Keep JSON string in sync with requestData changes (from sample selection)
+  // Keep JSON string in sync with requestData changes (from sample selection).
+  // Objects that already went through validateData were produced by this
+  // editor, which has set jsonString itself, so skip stringifying them again.
   useEffect(() => {
+    if (requestData === lastValidatedRef.current) return;
     const newJsonString = JSON.stringify(requestData, null, 2);
     setJsonString(newJsonString);
     setParseError(null);
   }, [requestData]);
 
-  // Initial validation
+  // Initial validation (skipped when this exact object was already validated)
   useEffect(() => {
+    if (requestData === lastValidatedRef.current) return;
     validateData(requestData);
   }, [requestData, validateData]);
 
@@ -286,16 +305,6 @@ function VrpJsonEditorContent({
   // Set up callback for AI modifications (separate useEffect to avoid circular dependency)
   useEffect(() => {
     const handleVrpDataUpdate = (modifiedData: Vrp.VrpSyncSolveParams) => {
-      console.log(
-        "🤖 VrpJsonEditor: AI modified data, updating editor and notifying parent...",
-        {
-          hasJobs: Array.isArray(modifiedData?.jobs),
-          jobCount: modifiedData?.jobs?.length,
-          hasResources: Array.isArray(modifiedData?.resources),
-          resourceCount: modifiedData?.resources?.length,
-        },
-      );
-
       const editor = editorRef.current;
       const oldJsonString = jsonString;
       const newJsonString = JSON.stringify(modifiedData, null, 2);
@@ -305,9 +314,6 @@ function VrpJsonEditorContent({
       setParseError(null);
 
       // Notify parent component of the change
-      console.log(
-        "🤖 VrpJsonEditor: Calling onChange to notify VrpExplorer...",
-      );
       onChange(modifiedData as unknown as Record<string, unknown>);
 
       // Validate the new data
@@ -378,9 +384,8 @@ function VrpJsonEditorContent({
 
     // Configure Monaco JSON language defaults with VRP schema
     try {
-      // Fetch the VRP JSON Schema
-      const response = await fetch("/schemas/vrp-request.schema.json");
-      const schema = await response.json();
+      // Fetch the VRP JSON Schema (cached after the first mount)
+      const schema = await loadVrpSchema();
 
       // Configure JSON language defaults
       monaco.languages.json.jsonDefaults.setDiagnosticsOptions({
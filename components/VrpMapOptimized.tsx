@@ -4,7 +4,7 @@ import { useEffect, useRef, useState, useCallback, useMemo } from 'react'
 import maplibregl from 'maplibre-gl'
 import { Vrp } from 'solvice-vrp-solver/resources/vrp/vrp'
 import { Loader2 } from 'lucide-react'
-import { cn } from '@/lib/utils'
+import { cn, indexByName } from '@/lib/utils'
 import { MapRouteRenderer } from '@/lib/map-route-renderer'
 import { createResourceColorMap } from '@/lib/color-utils'
 import { useMapStyle } from '@/lib/hooks/useMapStyle'
@@ -157,13 +157,13 @@ export function VrpMapOptimized({ requestData, responseData, className, selected
     const resourceColors = createResourceColorMap(filteredResponseData.trips)
     const bounds = new maplibregl.LngLatBounds()
     const jobFeatures: GeoJSON.Feature[] = []
-    const jobs = requestData.jobs as Array<Record<string, unknown>> | undefined
+    const jobsByName = indexByName(requestData.jobs as Array<Record<string, unknown>> | undefined)
 
     filteredResponseData.trips?.forEach((trip) => {
       const color = resourceColors.get(trip.resource || '') || '#3B82F6'
 
       trip.visits?.forEach((visit, idx) => {
-        const job = jobs?.find((j) => j.name === visit.job)
+        const job = jobsByName.get(visit.job)
         if (job?.location && typeof job.location === 'object') {
           const loc = job.location as { longitude: number; latitude: number }
 
@@ -126,9 +126,11 @@ function childrenTakeAllStringContents(element: any): string {
     const children = element.props.children
 
     if (Array.isArray(children)) {
-      return children
-        .map((child) => childrenTakeAllStringContents(child))
-        .join("")
+      let text = ""
+      for (const child of children) {
+        text += childrenTakeAllStringContents(child)
+      }
+      return text
     } else {
       return childrenTakeAllStringContents(children)
     }
@@ -23,6 +23,9 @@ export interface BudgetCheckResult {
 class CostGuardian {
   private dailyBudget = 50.00; // $50/day maximum for demo
   private tracker: DailyCostTracker | null = null;
+  // Estimated cost of requests that passed the budget check but haven't
+  // recorded their actual cost yet
+  private reservedCost = 0;
 
   /**
    * Check if a request with estimated cost is within daily budget
@@ -40,12 +43,15 @@ class CostGuardian {
       };
     }
 
-    const projectedTotal = this.tracker.totalCost + estimatedCost;
+    const projectedTotal = this.tracker.totalCost + this.reservedCost + estimatedCost;
 
     if (projectedTotal > this.dailyBudget) {
+      const reservedNote = this.reservedCost > 0
+        ? ` (plus $${this.reservedCost.toFixed(2)} reserved by in-flight requests)`
+        : '';
       return {
         allowed: false,
-        reason: `Daily demo budget of $${this.dailyBudget} exceeded. Current spend: $${this.tracker.totalCost.toFixed(2)}. Try again tomorrow or sign up for higher limits.`,
+        reason: `Daily demo budget of $${this.dailyBudget} exceeded. Current spend: $${this.tracker.totalCost.toFixed(2)}${reservedNote}. Try again tomorrow or sign up for higher limits.`,
         currentSpend: this.tracker.totalCost,
         budgetRemaining: 0,
         budgetLimit: this.dailyBudget,
@@ -60,6 +66,25 @@ class CostGuardian {
     };
   }
 
+  /**
+   * Check the budget and, if allowed, hold the estimated cost until
+   * releaseBudget() so concurrent requests can't all pass the same check
+   */
+  reserveBudget(estimatedCost: number): BudgetCheckResult {
+    const result = this.checkBudget(estimatedCost);
+    if (result.allowed) {
+      this.reservedCost += estimatedCost;
+    }
+    return result;
+  }
+
+  /**
+   * Release a reservation made by reserveBudget()
+   */
+  releaseBudget(estimatedCost: number): void {
+    this.reservedCost = Math.max(0, this.reservedCost - estimatedCost);
+  }
+
   /**
    * Record actual cost after API call completes
    */
@@ -128,12 +153,10 @@ class CostGuardian {
    */
   reset(): void {
     this.tracker = null;
+    this.reservedCost = 0;
     console.log('🔄 Cost Guardian: Tracker reset');
   }
 }
 
 // Singleton instance
-export const costGuardian = new CostGuardian();
-
-// Log initialization
-console.log('💰 Cost Guardian initialized with $50/day budget limit');
\ No newline at end of file
+export const costGuardian = new CostGuardian();
\ No newline at end of file
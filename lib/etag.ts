@@ -0,0 +1,20 @@
+import { createHash } from 'node:crypto'
+
+/**
+ * Strong ETag for a response body, so polling clients can revalidate cheaply
+ */
+export function createETag(body: string): string {
+  return `"${createHash('sha256').update(body).digest('base64url').slice(0, 22)}"`
+}
+
+/**
+ * Whether an If-None-Match header matches the given ETag.
+ * Handles lists, weak (W/) validators and the `*` wildcard.
+ */
+export function matchesETag(ifNoneMatch: string | null, etag: string): boolean {
+  if (!ifNoneMatch) return false
+  return ifNoneMatch.split(',').some(tag => {
+    const candidate = tag.trim()
+    return candidate === '*' || candidate === etag || candidate === `W/${etag}`
+  })
+}
@@ -286,10 +286,12 @@ export class HighlightManager {
       // Create grouping key based on path (excluding leaf property)
       const groupKey = change.path.slice(0, -1).join('.')
       
-      if (!grouped.has(groupKey)) {
-        grouped.set(groupKey, [])
+      const group = grouped.get(groupKey)
+      if (group) {
+        group.push(change)
+      } else {
+        grouped.set(groupKey, [change])
       }
-      grouped.get(groupKey)!.push(change)
     }
 
     // Merge groups with multiple changes into summary changes where appropriate
@@ -406,23 +408,18 @@ export class HighlightManager {
    * Prune old sessions to maintain limit
    */
   private pruneOldSessions(): void {
-    if (this.sessions.size <= this.options.maxSessions) return
-
-    const sortedSessions = Array.from(this.sessions.entries())
-      .sort(([, a], [, b]) => b.timestamp.getTime() - a.timestamp.getTime())
-
-    // Keep only the most recent sessions
-    const sessionsToKeep = sortedSessions.slice(0, this.options.maxSessions)
-    const sessionsToRemove = sortedSessions.slice(this.options.maxSessions)
+    // Sessions are inserted as they are created, so the Map iterates oldest
+    // first and pruning only touches the evicted entries
+    while (this.sessions.size > this.options.maxSessions) {
+      const oldestId = this.sessions.keys().next().value
+      if (oldestId === undefined) break
 
-    this.sessions.clear()
-    sessionsToKeep.forEach(([id, session]) => {
-      this.sessions.set(id, session)
-    })
+      this.sessions.delete(oldestId)
 
-    // If current session was removed, clear it
-    if (this.currentSession && sessionsToRemove.some(([id]) => id === this.currentSession!.id)) {
-      this.currentSession = null
+      // If current session was removed, clear it
+      if (this.currentSession?.id === oldestId) {
+        this.currentSession = null
+      }
     }
   }
 
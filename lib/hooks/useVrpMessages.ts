@@ -1,13 +1,18 @@
-import { useState, useEffect, useCallback } from 'react'
+import { useState, useEffect, useCallback, useRef } from 'react'
 import { Message, ExecutionMetadata } from '@/components/ui/chat-message'
 import { ChatPersistence } from '@/components/VrpAssistant/ChatPersistence'
 
+// Messages usually arrive in bursts (user message, status, reply), so
+// persistence is coalesced into one write per burst
+const SAVE_DEBOUNCE_MS = 300
+
 /**
  * Custom hook for managing VRP Assistant chat messages
  * Handles message state, persistence to localStorage, and message operations
  */
 export function useVrpMessages() {
   const [messages, setMessages] = useState<Message[]>([])
+  const pendingSaveRef = useRef<Message[] | null>(null)
 
   // Load messages from localStorage on mount
   useEffect(() => {
@@ -17,13 +22,45 @@ export function useVrpMessages() {
     }
   }, [])
 
-  // Save messages to localStorage whenever messages change
+  // Save messages to localStorage once changes settle
   useEffect(() => {
-    if (messages.length > 0) {
+    if (messages.length === 0) return
+
+    pendingSaveRef.current = messages
+    const timer = setTimeout(() => {
       ChatPersistence.saveMessages(messages)
-    }
+      pendingSaveRef.current = null
+    }, SAVE_DEBOUNCE_MS)
+
+    return () => clearTimeout(timer)
   }, [messages])
 
+  // Flush a pending save when the page is hidden or the component unmounts,
+  // so the last messages are not lost (closing or reloading the tab does not
+  // unmount React components)
+  useEffect(() => {
+    const flushPendingSave = () => {
+      if (pendingSaveRef.current) {
+        ChatPersistence.saveMessages(pendingSaveRef.current)
+        pendingSaveRef.current = null
+      }
+    }
+    const handleVisibilityChange = () => {
+      if (document.visibilityState === 'hidden') {
+        flushPendingSave()
+      }
+    }
+
+    window.addEventListener('pagehide', flushPendingSave)
+    document.addEventListener('visibilitychange', handleVisibilityChange)
+
+    return () => {
+      window.removeEventListener('pagehide', flushPendingSave)
+      document.removeEventListener('visibilitychange', handleVisibilityChange)
+      flushPendingSave()
+    }
+  }, [])
+
   // Add a new message to the conversation
   const addMessage = useCallback((
     role: 'user' | 'assistant' | 'system',
@@ -42,6 +79,7 @@ export function useVrpMessages() {
 
   // Clear all messages and localStorage
   const clearMessages = useCallback(() => {
+    pendingSaveRef.current = null
     setMessages([])
     ChatPersistence.clearMessages()
   }, [])
@@ -24,21 +24,24 @@ export interface SanitizationResult {
 const SAFE_NAME_PATTERN = /^[a-zA-Z0-9_\- .,():#@]+$/;
 const MAX_NAME_LENGTH = 100;
 
+/**
+ * Patterns that indicate injection attempts, compiled once at module load
+ */
+const SUSPICIOUS_PATTERNS = [
+  /[<>]/,                    // HTML tags
+  /javascript:/i,            // JavaScript protocol
+  /on\w+=/i,                 // Event handlers (onclick, onload, etc.)
+  /\${/,                     // Template literals
+  /`/,                       // Backticks
+  /<script/i,                // Script tags
+  /exec|eval|system/i,       // Command execution
+];
+
 /**
  * Check if a string contains suspicious patterns
  */
 function containsSuspiciousPattern(value: string): boolean {
-  const suspiciousPatterns = [
-    /[<>]/,                    // HTML tags
-    /javascript:/i,            // JavaScript protocol
-    /on\w+=/i,                 // Event handlers (onclick, onload, etc.)
-    /\${/,                     // Template literals
-    /`/,                       // Backticks
-    /<script/i,                // Script tags
-    /exec|eval|system/i,       // Command execution
-  ];
-
-  return suspiciousPatterns.some(pattern => pattern.test(value));
+  return SUSPICIOUS_PATTERNS.some(pattern => pattern.test(value));
 }
 
 /**
@@ -104,8 +107,10 @@ export function sanitizeVrpInput(vrpData: Vrp.VrpSyncSolveParams): SanitizationR
   const errors: string[] = [];
   const warnings: string[] = [];
 
-  // Create a copy to sanitize
-  const sanitized = JSON.parse(JSON.stringify(vrpData)) as Vrp.VrpSyncSolveParams;
+  // Shallow copy is enough: jobs and resources are remapped into new objects
+  // below and nothing nested is mutated, so the caller's data stays untouched
+  // without a JSON round-trip of the whole request
+  const sanitized = { ...vrpData } as Vrp.VrpSyncSolveParams;
 
   // Validate and sanitize job names
   if (Array.isArray(sanitized.jobs)) {
@@ -1,4 +1,5 @@
 import { Vrp } from 'solvice-vrp-solver/resources/vrp/vrp'
+import { EMPTY_ARRAY } from './utils'
 
 export type ChangeType = 'added' | 'modified' | 'removed' | 'unchanged'
 
@@ -38,8 +39,8 @@ export class JsonDiffService {
     
     // Compare jobs array
     this.compareArrays(
-      original.jobs || [],
-      modified.jobs || [],
+      original.jobs || EMPTY_ARRAY,
+      modified.jobs || EMPTY_ARRAY,
       ['jobs'],
       changes,
       this.compareJobs.bind(this)
@@ -47,8 +48,8 @@ export class JsonDiffService {
     
     // Compare resources array
     this.compareArrays(
-      original.resources || [],
-      modified.resources || [],
+      original.resources || EMPTY_ARRAY,
+      modified.resources || EMPTY_ARRAY,
       ['resources'],
       changes,
       this.compareResources.bind(this)
@@ -67,8 +68,8 @@ export class JsonDiffService {
     // Compare relations
     if (original.relations || modified.relations) {
       this.compareArrays(
-        original.relations || [],
-        modified.relations || [],
+        original.relations || EMPTY_ARRAY,
+        modified.relations || EMPTY_ARRAY,
         ['relations'],
         changes,
         this.compareRelations.bind(this)
@@ -115,8 +116,8 @@ export class JsonDiffService {
    * Compare two arrays and detect changes
    */
   private static compareArrays<T>(
-    originalArray: T[],
-    modifiedArray: T[],
+    originalArray: readonly T[],
+    modifiedArray: readonly T[],
     basePath: string[],
     changes: JsonChange[],
     itemComparer?: (original: T, modified: T, path: string[], changes: JsonChange[]) => void
@@ -228,8 +229,8 @@ export class JsonDiffService {
     // Compare load array
     if (original.load || modified.load) {
       this.compareArrays(
-        original.load || [],
-        modified.load || [],
+        original.load || EMPTY_ARRAY,
+        modified.load || EMPTY_ARRAY,
         [...path, 'load'],
         changes
       )
@@ -238,8 +239,8 @@ export class JsonDiffService {
     // Compare windows array
     if (original.windows || modified.windows) {
       this.compareArrays(
-        original.windows || [],
-        modified.windows || [],
+        original.windows || EMPTY_ARRAY,
+        modified.windows || EMPTY_ARRAY,
         [...path, 'windows'],
         changes,
         (origWindow, modWindow, windowPath, windowChanges) => {
@@ -251,8 +252,8 @@ export class JsonDiffService {
     // Compare tags array
     if (original.tags || modified.tags) {
       this.compareArrays(
-        original.tags || [],
-        modified.tags || [],
+        original.tags || EMPTY_ARRAY,
+        modified.tags || EMPTY_ARRAY,
         [...path, 'tags'],
         changes,
         (origTag, modTag, tagPath, tagChanges) => {
@@ -286,8 +287,8 @@ export class JsonDiffService {
     // Compare capacity array
     if (original.capacity || modified.capacity) {
       this.compareArrays(
-        original.capacity || [],
-        modified.capacity || [],
+        original.capacity || EMPTY_ARRAY,
+        modified.capacity || EMPTY_ARRAY,
         [...path, 'capacity'],
         changes
       )
@@ -296,8 +297,8 @@ export class JsonDiffService {
     // Compare tags array
     if (original.tags || modified.tags) {
       this.compareArrays(
-        original.tags || [],
-        modified.tags || [],
+        original.tags || EMPTY_ARRAY,
+        modified.tags || EMPTY_ARRAY,
         [...path, 'tags'],
         changes
       )
@@ -305,8 +306,8 @@ export class JsonDiffService {
     
     // Compare shifts array
     this.compareArrays(
-      original.shifts || [],
-      modified.shifts || [],
+      original.shifts || EMPTY_ARRAY,
+      modified.shifts || EMPTY_ARRAY,
       [...path, 'shifts'],
       changes,
       (origShift, modShift, shiftPath, shiftChanges) => {
@@ -317,8 +318,8 @@ export class JsonDiffService {
     // Compare rules array
     if (original.rules || modified.rules) {
       this.compareArrays(
-        original.rules || [],
-        modified.rules || [],
+        original.rules || EMPTY_ARRAY,
+        modified.rules || EMPTY_ARRAY,
         [...path, 'rules'],
         changes,
         (origRule, modRule, rulePath, ruleChanges) => {
@@ -349,6 +350,9 @@ export class JsonDiffService {
     path: string[],
     changes: JsonChange[]
   ): void {
+    // Identical references and equal primitives need no serialization
+    if (original === modified) return
+
     if (JSON.stringify(original) !== JSON.stringify(modified)) {
       changes.push({
         type: 'modified',
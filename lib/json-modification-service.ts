@@ -22,6 +22,11 @@ export interface ProcessingOptions {
   includeContext?: boolean
 }
 
+interface DataContext {
+  statistics: string
+  guidance: string[]
+}
+
 export class JsonModificationService {
   private openAIService: OpenAIService
   private maxRetries: number = 3
@@ -59,6 +64,9 @@ export class JsonModificationService {
       }
     }
 
+    // Data-derived hints don't change between attempts, so compute them once
+    const dataContext = this.buildDataContext(currentData, options)
+
     while (attempts < maxRetries) {
       attempts++
       
@@ -67,7 +75,7 @@ export class JsonModificationService {
         const aiRequest: VrpModificationRequest = {
           currentData,
           userRequest,
-          context: this.buildRequestContext(currentData, attempts, lastError, options)
+          context: this.buildRequestContext(dataContext, attempts, lastError)
         }
 
         // Get AI response
@@ -226,44 +234,61 @@ export class JsonModificationService {
   }
 
   /**
-   * Build contextual information for AI request
+   * Build the parts of the AI request context that depend only on the input data
    */
-  private buildRequestContext(
+  private buildDataContext(
     currentData: Vrp.VrpSyncSolveParams,
-    attempt: number,
-    lastError: string | null,
     options: ProcessingOptions
-  ): string {
-    const context: string[] = []
-
-    // Add basic statistics
-    context.push(`Current VRP has ${currentData.jobs.length} jobs and ${currentData.resources.length} resources.`)
-
-    // Add retry information if this is not the first attempt
-    if (attempt > 1) {
-      context.push(`This is attempt ${attempt}. Previous attempt failed with: ${lastError}`)
-      context.push('Please ensure the response follows the exact JSON format and contains valid VRP data.')
-    }
+  ): DataContext {
+    const guidance: string[] = []
+    // Unvalidated input may lack either list; this runs outside the retry
+    // loop's error handling, so it must not throw
+    const jobs = currentData.jobs ?? []
+    const resources = currentData.resources ?? []
 
     // Add specific guidance based on data characteristics
-    if (currentData.jobs.length > 50) {
-      context.push('This is a large VRP instance. Be conservative with modifications.')
+    if (jobs.length > 50) {
+      guidance.push('This is a large VRP instance. Be conservative with modifications.')
     }
 
-    if (currentData.jobs.some(job => job.windows && job.windows.length > 0)) {
-      context.push('This VRP has time windows. Ensure any new jobs have appropriate time constraints.')
+    if (jobs.some(job => job.windows && job.windows.length > 0)) {
+      guidance.push('This VRP has time windows. Ensure any new jobs have appropriate time constraints.')
     }
 
-    if (currentData.resources.some(res => res.capacity && res.capacity.length > 0)) {
-      context.push('This VRP uses capacity constraints. Consider load balancing when modifying.')
+    if (resources.some(res => res.capacity && res.capacity.length > 0)) {
+      guidance.push('This VRP uses capacity constraints. Consider load balancing when modifying.')
     }
 
     // Add validation reminders
     if (options.validateResult !== false) {
-      context.push('Ensure all job and resource names are unique and all required fields are present.')
-      context.push('Use ISO datetime format (YYYY-MM-DDTHH:mm:ssZ) for all time fields.')
+      guidance.push('Ensure all job and resource names are unique and all required fields are present.')
+      guidance.push('Use ISO datetime format (YYYY-MM-DDTHH:mm:ssZ) for all time fields.')
+    }
+
+    return {
+      statistics: `Current VRP has ${jobs.length} jobs and ${resources.length} resources.`,
+      guidance
+    }
+  }
+
+  /**
+   * Build contextual information for AI request
+   */
+  private buildRequestContext(
+    dataContext: DataContext,
+    attempt: number,
+    lastError: string | null
+  ): string {
+    const context: string[] = [dataContext.statistics]
+
+    // Add retry information if this is not the first attempt
+    if (attempt > 1) {
+      context.push(`This is attempt ${attempt}. Previous attempt failed with: ${lastError}`)
+      context.push('Please ensure the response follows the exact JSON format and contains valid VRP data.')
     }
 
+    context.push(...dataContext.guidance)
+
     return context.join(' ')
   }
 
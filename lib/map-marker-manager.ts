@@ -1,5 +1,6 @@
 import maplibregl from 'maplibre-gl'
 import { Vrp } from 'solvice-vrp-solver/resources/vrp/vrp'
+import { indexByName } from './utils'
 
 export interface MarkerMetadata {
   resource: string
@@ -159,12 +160,14 @@ export class MapMarkerManager {
   ): void {
     if (!trips || !jobs) return
 
+    const jobsByName = indexByName(jobs)
+
     trips.forEach((trip) => {
       const resourceName = trip.resource || 'Unknown'
       const vehicleColor = resourceColors.get(resourceName) || '#3B82F6'
 
       trip.visits?.forEach((visit, visitIndex) => {
-        const job = jobs.find((j) => j.name === visit.job)
+        const job = jobsByName.get(visit.job)
         if (job?.location && typeof job.location === 'object' && job.location !== null) {
           const location = job.location as { longitude?: number; latitude?: number }
           if (typeof location.longitude === 'number' && typeof location.latitude === 'number') {
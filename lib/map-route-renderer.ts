@@ -1,6 +1,7 @@
 import maplibregl from 'maplibre-gl'
 import { Vrp } from 'solvice-vrp-solver/resources/vrp/vrp'
 import { decodePolyline, isEncodedPolyline } from './polyline-decoder'
+import { indexByName } from './utils'
 
 interface LayerEventHandlers {
   mouseenter: (e: maplibregl.MapLayerMouseEvent) => void
@@ -76,7 +77,8 @@ export class MapRouteRenderer {
    */
   private createRouteGeometry(
     trip: Vrp.OnRouteResponse['trips'][0],
-    requestData: Record<string, unknown>,
+    jobsByName: Map<unknown, Record<string, unknown>>,
+    resourcesByName: Map<unknown, Record<string, unknown>>,
     tripIndex: number
   ): GeoJSON.LineString | null {
     // Try polyline first
@@ -102,8 +104,7 @@ export class MapRouteRenderer {
     const coordinates: [number, number][] = []
 
     // Find the vehicle/resource for this trip
-    const resources = requestData.resources as Array<Record<string, unknown>> | undefined
-    const resource = resources?.find((r) => r.name === trip.resource)
+    const resource = resourcesByName.get(trip.resource)
 
     // Start from depot if available
     const shifts = resource?.shifts as Array<Record<string, unknown>> | undefined
@@ -117,8 +118,7 @@ export class MapRouteRenderer {
 
     // Add visit locations
     trip.visits?.forEach((visit) => {
-      const jobs = requestData.jobs as Array<Record<string, unknown>> | undefined
-      const job = jobs?.find((j) => j.name === visit.job)
+      const job = jobsByName.get(visit.job)
       if (job?.location && typeof job.location === 'object' && job.location !== null) {
         const location = job.location as { longitude?: number; latitude?: number }
         if (typeof location.longitude === 'number' && typeof location.latitude === 'number') {
@@ -159,6 +159,10 @@ export class MapRouteRenderer {
   ): void {
     if (!trips) return
 
+    // Index jobs and resources once instead of scanning them for every visit
+    const jobsByName = indexByName(requestData.jobs as Array<Record<string, unknown>> | undefined)
+    const resourcesByName = indexByName(requestData.resources as Array<Record<string, unknown>> | undefined)
+
     trips.forEach((trip, tripIndex) => {
       const resourceName = trip.resource || 'Unknown'
       const color = resourceColors.get(resourceName) || '#3B82F6'
@@ -167,7 +171,7 @@ export class MapRouteRenderer {
       const shadowId = `shadow-${tripIndex}`
 
       // Create route geometry
-      const routeGeometry = this.createRouteGeometry(trip, requestData, tripIndex)
+      const routeGeometry = this.createRouteGeometry(trip, jobsByName, resourcesByName, tripIndex)
 
       if (!routeGeometry) return
 
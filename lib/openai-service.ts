@@ -65,6 +65,14 @@ interface ModelSelectionContext {
   requiresReasoning?: boolean;
 }
 
+// Serialized VRP payloads keyed by object identity. The assistant keeps the
+// same VRP object across chat turns until it is modified, so repeat requests
+// against unchanged data skip re-serialization.
+const serializedVrpCache = new WeakMap<object, string>();
+
+// Sampled suggestion payloads, keyed by the full VRP object they were built from
+const suggestionsPayloadCache = new WeakMap<object, string>();
+
 export class OpenAIService {
   private static readonly API_BASE_URL = '/api/openai/chat';
 
@@ -74,6 +82,108 @@ export class OpenAIService {
     'gpt-4o-mini': { input: 0.15, output: 0.60 },
   };
 
+  // Upper bound on jobs embedded in a suggestions prompt
+  private static readonly MAX_SUGGESTION_JOBS = 25;
+
+  // Keywords that route a modification request to the full model
+  private static readonly COMPLEX_REASONING_KEYWORDS = [
+    'optimize', 'rebalance', 'redistribute', 'analyze',
+    'compare', 'multiple', 'all', 'every', 'best',
+  ];
+
+  // Prompts only depend on the static schema text, so build them once
+  private static readonly VRP_MODIFICATION_SYSTEM_PROMPT = `You are a VRP optimization assistant. Modify VRP JSON based on user requests.
+
+${VrpSchemaService.getCompactSchemaForAI()}
+
+## Response Format (JSON only):
+{
+  "modifiedData": {/* complete VRP */},
+  "explanation": "What changed",
+  "changes": [{"type": "add|modify|remove", "target": "job|resource|option", "description": "..."}]
+}
+
+## Rules:
+- JSON only, no extra text
+- Preserve jobs[], resources[] structure
+- Keep existing data unless removal requested
+- ISO datetimes (YYYY-MM-DDTHH:mm:ssZ)
+- Unique names
+- Focus on requested changes only`;
+
+  private static readonly SUGGESTIONS_SYSTEM_PROMPT = `VRP expert. Analyze data, suggest 3-5 improvements.
+
+${VrpSchemaService.getCompactSchemaForAI()}
+
+Focus: efficiency, time windows, capacity, practical changes.
+Return: JSON array of strings.`;
+
+  private static readonly CSV_CONVERSION_SYSTEM_PROMPT = `You are a VRP (Vehicle Routing Problem) data converter. Convert CSV data to valid VRP JSON format.
+
+${VrpSchemaService.getSchemaForAI()}
+
+## Conversion Instructions:
+1. Analyze CSV columns to identify:
+   - Location data (lat/lon coordinates, addresses)
+   - Service times/durations
+   - Time windows
+   - Demands/quantities
+   - Vehicle information
+
+2. Map CSV data to VRP structure:
+   - Each CSV row (except header) becomes a job in the jobs array
+   - Create reasonable vehicle resources based on job count
+   - Use intelligent field mapping (lat/latitude → location.latitude, etc.)
+   - Convert time formats to ISO datetime (YYYY-MM-DDTHH:mm:ssZ)
+   - Convert durations to seconds
+
+3. Generate defaults for missing data:
+   - Single vehicle starting from depot (first job location or center)
+   - 8-hour work shift (08:00-18:00) if no times specified
+   - 15-minute default service duration if not provided
+   - Enable polylines and partial planning options
+
+4. Ensure data quality:
+   - Job names must be unique (add suffixes if needed)
+   - All coordinates must be valid numbers
+   - All datetime values must use proper ISO format
+   - Resource shifts must have start/end locations
+
+## Required JSON Response Format:
+{
+  "vrpData": { /* complete VRP request object */ },
+  "explanation": "Brief explanation of the conversion",
+  "conversionNotes": ["Note about assumption 1", "Note about assumption 2"],
+  "rowsProcessed": number
+}
+
+## Rules:
+- RESPOND ONLY WITH VALID JSON - no additional text
+- Use conservative defaults for missing data
+- Preserve all location data with proper lat/lon coordinates
+- Generate descriptive job names if CSV names are poor
+- Ensure generated VRP passes validation
+- Include helpful notes about assumptions made during conversion`;
+
+  private static readonly CODE_INTERPRETER_INSTRUCTIONS = `VRP data converter using Code Interpreter.
+
+1. Load CSV(s) with pandas
+2. Multiple files: identify relationships, merge
+3. Transform: durations (min→sec), map coordinates, create jobs/resources
+4. Return JSON
+
+VRP schema:
+${VrpSchemaService.getCompactSchemaForAI()}
+
+## Steps:
+Single: Load→map columns→create jobs→generate vehicles→validate
+Multiple: Load all→identify types/relationships→merge→convert→validate
+
+## Output:
+{"vrpData": {...}, "explanation": "...", "conversionNotes": [...], "rowsProcessed": N}
+
+Show work, provide final JSON.`;
+
   constructor() {
     // No client initialization needed - using server-side API
   }
@@ -136,13 +246,10 @@ export class OpenAIService {
    * Detect if VRP modification requires complex reasoning
    */
   private requiresComplexReasoning(request: VrpModificationRequest): boolean {
-    const complexKeywords = [
-      'optimize', 'rebalance', 'redistribute', 'analyze',
-      'compare', 'multiple', 'all', 'every', 'best',
-    ];
+    const userRequest = request.userRequest.toLowerCase();
 
-    return complexKeywords.some(keyword =>
-      request.userRequest.toLowerCase().includes(keyword)
+    return OpenAIService.COMPLEX_REASONING_KEYWORDS.some(keyword =>
+      userRequest.includes(keyword)
     );
   }
 
@@ -244,10 +351,6 @@ export class OpenAIService {
     });
 
     try {
-      console.log('🤖 Calling OpenAI API with structured output...');
-      console.log('Model:', modelConfig.model);
-      console.log('Messages length:', messages.length);
-
       const response = await fetch(OpenAIService.API_BASE_URL, {
         method: 'POST',
         headers: {
@@ -269,9 +372,6 @@ export class OpenAIService {
 
       const data = await response.json();
 
-      console.log('✅ OpenAI response received');
-      console.log('Usage:', data.usage);
-
       // Track usage
       if (data.usage) {
         telemetryService.logUsage({
@@ -291,12 +391,7 @@ export class OpenAIService {
         throw new Error("No content in OpenAI response");
       }
 
-      console.log('📝 Response content length:', content.length);
-
-      const parsed = JSON.parse(content) as VrpModificationResponse;
-      console.log('✅ Successfully parsed JSON response');
-
-      return parsed;
+      return JSON.parse(content) as VrpModificationResponse;
     } catch (error: unknown) {
       // Track failed request
       telemetryService.logUsage({
@@ -359,11 +454,14 @@ export class OpenAIService {
   async modifyVrpData(
     request: VrpModificationRequest,
   ): Promise<VrpModificationResponse> {
+    // Prompts are identical across retries, so build them once. The VRP data
+    // comes before the user request, which keeps the prompt prefix stable
+    // between turns on the same data.
+    const systemPrompt = this.buildOptimizedVrpSystemPrompt();
+    const userMessage = this.buildVrpUserMessage(request);
+
     try {
       return await ErrorHandlingService.withRetry(async () => {
-        const systemPrompt = this.buildOptimizedVrpSystemPrompt();
-        const userMessage = this.buildVrpUserMessage(request);
-
         const result = await this.sendStructuredMessage(userMessage, systemPrompt);
 
         // Validate the modified data structure
@@ -401,24 +499,7 @@ export class OpenAIService {
    * Build optimized system prompt with VRP schema (reduced token count)
    */
   private buildOptimizedVrpSystemPrompt(): string {
-    return `You are a VRP optimization assistant. Modify VRP JSON based on user requests.
-
-${VrpSchemaService.getCompactSchemaForAI()}
-
-## Response Format (JSON only):
-{
-  "modifiedData": {/* complete VRP */},
-  "explanation": "What changed",
-  "changes": [{"type": "add|modify|remove", "target": "job|resource|option", "description": "..."}]
-}
-
-## Rules:
-- JSON only, no extra text
-- Preserve jobs[], resources[] structure
-- Keep existing data unless removal requested
-- ISO datetimes (YYYY-MM-DDTHH:mm:ssZ)
-- Unique names
-- Focus on requested changes only`;
+    return OpenAIService.VRP_MODIFICATION_SYSTEM_PROMPT;
   }
 
 
@@ -426,7 +507,7 @@ ${VrpSchemaService.getCompactSchemaForAI()}
    * Build user message with current data and request
    */
   private buildVrpUserMessage(request: VrpModificationRequest): string {
-    const currentDataStr = JSON.stringify(request.currentData, null, 2);
+    const currentDataStr = OpenAIService.serializeVrpData(request.currentData);
 
     let message = `Current VRP data:
 \`\`\`json
@@ -446,6 +527,42 @@ User request: ${request.userRequest}`;
   }
 
 
+  /**
+   * Serialize VRP data for a prompt, reusing the result for unchanged objects.
+   * Compact JSON: indentation only adds input tokens.
+   */
+  private static serializeVrpData(data: Vrp.VrpSyncSolveParams): string {
+    let serialized = serializedVrpCache.get(data);
+    if (serialized === undefined) {
+      serialized = JSON.stringify(data);
+      serializedVrpCache.set(data, serialized);
+    }
+    return serialized;
+  }
+
+  /**
+   * Serialize the job sample sent for suggestions, reusing the result for unchanged objects
+   */
+  private static serializeSuggestionsPayload(vrpData: Vrp.VrpSyncSolveParams): string {
+    const cached = suggestionsPayloadCache.get(vrpData);
+    if (cached !== undefined) {
+      return cached;
+    }
+
+    // Suggestions only need a representative sample, not every job
+    const jobCount = vrpData.jobs?.length ?? 0;
+    let payload: string;
+    if (jobCount > OpenAIService.MAX_SUGGESTION_JOBS) {
+      const sampledData = { ...vrpData, jobs: vrpData.jobs.slice(0, OpenAIService.MAX_SUGGESTION_JOBS) };
+      payload = `${JSON.stringify(sampledData)}\n(Showing ${OpenAIService.MAX_SUGGESTION_JOBS} of ${jobCount} jobs)`;
+    } else {
+      payload = OpenAIService.serializeVrpData(vrpData);
+    }
+
+    suggestionsPayloadCache.set(vrpData, payload);
+    return payload;
+  }
+
   /**
    * Generate contextual suggestions based on current VRP data
    */
@@ -455,14 +572,8 @@ User request: ${request.userRequest}`;
     const startTime = Date.now();
     const modelConfig = this.selectOptimalModel({ requestType: 'suggestions' });
 
-    const systemPrompt = `VRP expert. Analyze data, suggest 3-5 improvements.
-
-${VrpSchemaService.getCompactSchemaForAI()}
-
-Focus: efficiency, time windows, capacity, practical changes.
-Return: JSON array of strings.`;
-
-    const userMessage = `Suggest improvements:\n${JSON.stringify(vrpData, null, 2)}\n\nReturn 3-5 suggestions as JSON array.`;
+    const systemPrompt = OpenAIService.SUGGESTIONS_SYSTEM_PROMPT;
+    const userMessage = `Suggest improvements:\n${OpenAIService.serializeSuggestionsPayload(vrpData)}\n\nReturn 3-5 suggestions as JSON array.`;
 
     try {
       const response = await fetch(OpenAIService.API_BASE_URL, {
@@ -674,76 +785,14 @@ Return: JSON array of strings.`;
    * Build system prompt for CSV to VRP conversion
    */
   static buildCsvConversionSystemPrompt(): string {
-    return `You are a VRP (Vehicle Routing Problem) data converter. Convert CSV data to valid VRP JSON format.
-
-${VrpSchemaService.getSchemaForAI()}
-
-## Conversion Instructions:
-1. Analyze CSV columns to identify:
-   - Location data (lat/lon coordinates, addresses)
-   - Service times/durations
-   - Time windows
-   - Demands/quantities
-   - Vehicle information
-
-2. Map CSV data to VRP structure:
-   - Each CSV row (except header) becomes a job in the jobs array
-   - Create reasonable vehicle resources based on job count
-   - Use intelligent field mapping (lat/latitude → location.latitude, etc.)
-   - Convert time formats to ISO datetime (YYYY-MM-DDTHH:mm:ssZ)
-   - Convert durations to seconds
-
-3. Generate defaults for missing data:
-   - Single vehicle starting from depot (first job location or center)
-   - 8-hour work shift (08:00-18:00) if no times specified
-   - 15-minute default service duration if not provided
-   - Enable polylines and partial planning options
-
-4. Ensure data quality:
-   - Job names must be unique (add suffixes if needed)
-   - All coordinates must be valid numbers
-   - All datetime values must use proper ISO format
-   - Resource shifts must have start/end locations
-
-## Required JSON Response Format:
-{
-  "vrpData": { /* complete VRP request object */ },
-  "explanation": "Brief explanation of the conversion",
-  "conversionNotes": ["Note about assumption 1", "Note about assumption 2"],
-  "rowsProcessed": number
-}
-
-## Rules:
-- RESPOND ONLY WITH VALID JSON - no additional text
-- Use conservative defaults for missing data
-- Preserve all location data with proper lat/lon coordinates
-- Generate descriptive job names if CSV names are poor
-- Ensure generated VRP passes validation
-- Include helpful notes about assumptions made during conversion`;
+    return OpenAIService.CSV_CONVERSION_SYSTEM_PROMPT;
   }
 
   /**
    * Build instructions for Code Interpreter CSV conversion
    */
   static buildCodeInterpreterInstructions(): string {
-    return `VRP data converter using Code Interpreter.
-
-1. Load CSV(s) with pandas
-2. Multiple files: identify relationships, merge
-3. Transform: durations (min→sec), map coordinates, create jobs/resources
-4. Return JSON
-
-VRP schema:
-${VrpSchemaService.getCompactSchemaForAI()}
-
-## Steps:
-Single: Load→map columns→create jobs→generate vehicles→validate
-Multiple: Load all→identify types/relationships→merge→convert→validate
-
-## Output:
-{"vrpData": {...}, "explanation": "...", "conversionNotes": [...], "rowsProcessed": N}
-
-Show work, provide final JSON.`;
+    return OpenAIService.CODE_INTERPRETER_INSTRUCTIONS;
   }
 
   /**
@@ -20,6 +20,10 @@ interface RequestRecord {
   timestamps: number[]
 }
 
+// Upper bound on tracked keys. The Map is kept in least-recently-used order,
+// so the oldest entries are evicted first when the bound is reached.
+const MAX_TRACKED_KEYS = 10_000
+
 class RateLimiter {
   private requests = new Map<string, RequestRecord>()
 
@@ -30,12 +34,21 @@ class RateLimiter {
     const now = Date.now()
     const windowStart = now - config.windowMs
     
-    // Get or create request record for this key
+    // Get or create request record for this key, moving it to the
+    // most-recently-used end of the Map
     let record = this.requests.get(key)
-    if (!record) {
+    if (record) {
+      this.requests.delete(key)
+    } else {
       record = { timestamps: [] }
-      this.requests.set(key, record)
+      if (this.requests.size >= MAX_TRACKED_KEYS) {
+        const oldestKey = this.requests.keys().next().value
+        if (oldestKey !== undefined) {
+          this.requests.delete(oldestKey)
+        }
+      }
     }
+    this.requests.set(key, record)
 
     // Remove expired timestamps (outside current window)
     record.timestamps = record.timestamps.filter(timestamp => timestamp > windowStart)
@@ -0,0 +1,65 @@
+import { NextResponse } from 'next/server'
+
+// Maximum request body size in bytes (1MB)
+export const MAX_REQUEST_SIZE = 1_000_000
+
+export class PayloadTooLargeError extends Error {
+  constructor(public readonly maxSize: number = MAX_REQUEST_SIZE) {
+    super(`Request body exceeds maximum size of ${(maxSize / 1_000_000).toFixed(1)}MB`)
+    this.name = 'PayloadTooLargeError'
+  }
+}
+
+/**
+ * 413 response shared by the middleware and API routes
+ */
+export function payloadTooLargeResponse(actualSize?: number, maxSize: number = MAX_REQUEST_SIZE): NextResponse {
+  return NextResponse.json(
+    {
+      error: 'Request too large',
+      message: `Request body exceeds maximum size of ${(maxSize / 1_000_000).toFixed(1)}MB`,
+      type: 'payload_too_large',
+      maxSize,
+      ...(actualSize !== undefined && { actualSize }),
+    },
+    { status: 413 } // Payload Too Large
+  )
+}
+
+/**
+ * Read and parse a JSON request body, enforcing the size limit while streaming.
+ * The middleware rejects oversized bodies that declare a Content-Length; this
+ * covers chunked bodies that don't, without buffering past the limit.
+ */
+// Untyped by default, like Request.json()
+// eslint-disable-next-line @typescript-eslint/no-explicit-any
+export async function readJsonBody<T = any>(request: Request, maxSize: number = MAX_REQUEST_SIZE): Promise<T> {
+  if (!request.body) {
+    return request.json()
+  }
+
+  const reader = request.body.getReader()
+  const chunks: Uint8Array[] = []
+  let received = 0
+
+  while (true) {
+    const { done, value } = await reader.read()
+    if (done) break
+
+    received += value.byteLength
+    if (received > maxSize) {
+      await reader.cancel()
+      throw new PayloadTooLargeError(maxSize)
+    }
+    chunks.push(value)
+  }
+
+  const bytes = new Uint8Array(received)
+  let offset = 0
+  for (const chunk of chunks) {
+    bytes.set(chunk, offset)
+    offset += chunk.byteLength
+  }
+
+  return JSON.parse(new TextDecoder().decode(bytes)) as T
+}
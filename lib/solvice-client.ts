@@ -0,0 +1,31 @@
+import { SolviceVrpSolver } from 'solvice-vrp-solver'
+
+// Clients are cached per API key so keep-alive connections are reused across
+// requests. Keys can come from request headers, so the cache is bounded and
+// evicts the least recently used client.
+const MAX_CACHED_CLIENTS = 50
+
+const clients = new Map<string, SolviceVrpSolver>()
+
+/**
+ * Get a Solvice SDK client for an API key, reusing an existing instance
+ */
+export function getSolviceClient(apiKey: string): SolviceVrpSolver {
+  let client = clients.get(apiKey)
+
+  if (client) {
+    // Move to the most-recently-used end
+    clients.delete(apiKey)
+  } else {
+    client = new SolviceVrpSolver({ apiKey })
+    if (clients.size >= MAX_CACHED_CLIENTS) {
+      const oldestKey = clients.keys().next().value
+      if (oldestKey !== undefined) {
+        clients.delete(oldestKey)
+      }
+    }
+  }
+
+  clients.set(apiKey, client)
+  return client
+}
@@ -45,11 +45,13 @@ class TelemetryService {
       this.events = this.events.slice(-this.MAX_EVENTS);
     }
 
-    // Log to console for immediate visibility
-    const status = event.success ? '✅' : '❌';
-    console.log(
-      `📊 ${status} [${event.model}] ${event.operation}: ${event.totalTokens} tokens, $${event.estimatedCost.toFixed(4)}, ${event.latencyMs}ms`
-    );
+    // Log to console for immediate visibility during development
+    if (process.env.NODE_ENV === 'development') {
+      const status = event.success ? '✅' : '❌';
+      console.log(
+        `📊 ${status} [${event.model}] ${event.operation}: ${event.totalTokens} tokens, $${event.estimatedCost.toFixed(4)}, ${event.latencyMs}ms`
+      );
+    }
 
     // Persist to localStorage for debugging
     this.persistToStorage(fullEvent);
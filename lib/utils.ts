@@ -4,3 +4,24 @@ import { twMerge } from "tailwind-merge"
 export function cn(...inputs: ClassValue[]) {
   return twMerge(clsx(inputs))
 }
+
+/**
+ * Shared frozen stand-in for missing arrays, so hot paths don't allocate a
+ * fresh `[]` for every absent field.
+ */
+export const EMPTY_ARRAY: readonly never[] = Object.freeze([])
+
+/**
+ * Index records by their `name` field for O(1) lookups.
+ * The first record wins on duplicate names, matching Array.prototype.find.
+ */
+export function indexByName<T extends { name?: unknown }>(items: T[] | undefined): Map<unknown, T> {
+  const index = new Map<unknown, T>()
+  if (!items) return index
+  for (const item of items) {
+    if (!index.has(item.name)) {
+      index.set(item.name, item)
+    }
+  }
+  return index
+}
@@ -199,24 +199,41 @@ export class VrpAnalyzer {
    * Analyze job characteristics
    */
   private static analyzeJobs(jobs: Vrp.Job[]) {
-    const withTimeWindows = jobs.filter(j => j.windows && j.windows.length > 0).length
-    const withPriorities = jobs.filter(j => j.priority && j.priority > 1).length
-    const withTags = jobs.filter(j => j.tags && j.tags.length > 0).length
-    const withCapacityRequirements = jobs.filter(j => j.load && j.load.length > 0).length
+    let withTimeWindows = 0
+    let withPriorities = 0
+    let withTags = 0
+    let withCapacityRequirements = 0
+    let durationTotal = 0
+    let durationCount = 0
+    let windowCount = 0
+    let earliestStart = Infinity
+    let latestEnd = -Infinity
+
+    // Single pass over jobs collecting every metric
+    for (const job of jobs) {
+      if (job.priority && job.priority > 1) withPriorities++
+      if (job.tags && job.tags.length > 0) withTags++
+      if (job.load && job.load.length > 0) withCapacityRequirements++
+
+      if (job.duration) {
+        durationTotal += job.duration
+        durationCount++
+      }
+
+      if (job.windows && job.windows.length > 0) {
+        withTimeWindows++
+        for (const window of job.windows) {
+          earliestStart = Math.min(earliestStart, new Date(window.from).getHours())
+          latestEnd = Math.max(latestEnd, new Date(window.to).getHours())
+          windowCount++
+        }
+      }
+    }
 
-    const durations = jobs.filter(j => j.duration).map(j => j.duration!)
-    const averageDuration = durations.length > 0 ? durations.reduce((a, b) => a + b, 0) / durations.length : 0
+    const averageDuration = durationCount > 0 ? durationTotal / durationCount : 0
 
     // Calculate time spread from time windows
-    let timeSpread = 'Not specified'
-    const timeWindows = jobs.flatMap(j => j.windows || [])
-    if (timeWindows.length > 0) {
-      const startTimes = timeWindows.map(w => new Date(w.from).getHours())
-      const endTimes = timeWindows.map(w => new Date(w.to).getHours())
-      const earliestStart = Math.min(...startTimes)
-      const latestEnd = Math.max(...endTimes)
-      timeSpread = `${latestEnd - earliestStart} hours`
-    }
+    const timeSpread = windowCount > 0 ? `${latestEnd - earliestStart} hours` : 'Not specified'
 
     return {
       withTimeWindows,
@@ -232,16 +249,21 @@ export class VrpAnalyzer {
    * Analyze resource characteristics
    */
   private static analyzeResources(resources: Vrp.Resource[]) {
-    const withCapacityDefined = resources.filter(r => r.capacity && r.capacity.length > 0).length
-    const withTags = resources.filter(r => r.tags && r.tags.length > 0).length
-    const withMultipleShifts = resources.filter(r => r.shifts && r.shifts.length > 1).length
+    let withCapacityDefined = 0
+    let withTags = 0
+    let withMultipleShifts = 0
 
-    // Calculate working hours
+    // Calculate working hours alongside the per-resource counts
     let totalWorkingHours = 0
     let shiftCount = 0
     
     for (const resource of resources) {
+      if (resource.capacity && resource.capacity.length > 0) withCapacityDefined++
+      if (resource.tags && resource.tags.length > 0) withTags++
+
       if (resource.shifts) {
+        if (resource.shifts.length > 1) withMultipleShifts++
+
         for (const shift of resource.shifts) {
           const start = new Date(shift.from)
           const end = new Date(shift.to)
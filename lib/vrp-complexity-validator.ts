@@ -23,8 +23,9 @@ export interface ComplexityCheckResult {
   actualComplexity: {
     jobCount: number;
     resourceCount: number;
-    maxTimeWindows: number;
-    totalTimeWindows: number;
+    // Not computed when the job or vehicle cap is exceeded
+    maxTimeWindows?: number;
+    totalTimeWindows?: number;
   };
 }
 
@@ -36,6 +37,13 @@ export const DEMO_COMPLEXITY_LIMITS: ComplexityLimits = {
   maxBreaksPerResource: 3,
 };
 
+// Per-item violation messages, emitted from the job and shift loops
+const jobWindowsError = (job: string | number, count: number, max: number): string =>
+  `Job "${job}" has ${count} time windows (maximum ${max} for demo)`;
+
+const shiftBreaksError = (resource: string | number, shiftIdx: number, count: number, max: number): string =>
+  `Resource "${resource}" shift ${shiftIdx} has ${count} breaks (maximum ${max} for demo)`;
+
 /**
  * Validate VRP problem complexity against limits
  */
@@ -45,15 +53,16 @@ export function validateComplexity(
 ): ComplexityCheckResult {
   const errors: string[] = [];
   const warnings: string[] = [];
+  const { maxJobs, maxResources, maxTimeWindowsPerJob, maxBreaksPerResource } = limits;
 
   // Count jobs and resources
   const jobCount = vrpData.jobs?.length || 0;
   const resourceCount = vrpData.resources?.length || 0;
 
   // Check job count
-  if (jobCount > limits.maxJobs) {
+  if (jobCount > maxJobs) {
     errors.push(
-      `Too many jobs: ${jobCount} (maximum ${limits.maxJobs} for demo). Sign up for higher limits!`
+      `Too many jobs: ${jobCount} (maximum ${maxJobs} for demo). Sign up for higher limits!`
     );
   }
 
@@ -62,9 +71,9 @@ export function validateComplexity(
   }
 
   // Check resource count
-  if (resourceCount > limits.maxResources) {
+  if (resourceCount > maxResources) {
     errors.push(
-      `Too many vehicles: ${resourceCount} (maximum ${limits.maxResources} for demo). Sign up for higher limits!`
+      `Too many vehicles: ${resourceCount} (maximum ${maxResources} for demo). Sign up for higher limits!`
     );
   }
 
@@ -72,45 +81,59 @@ export function validateComplexity(
     errors.push('At least 1 vehicle/resource is required');
   }
 
+  // Warnings for approaching limits
+  if (jobCount > maxJobs * 0.8) {
+    warnings.push(`Approaching job limit (${jobCount}/${maxJobs})`);
+  }
+
+  if (resourceCount > maxResources * 0.8) {
+    warnings.push(`Approaching resource limit (${resourceCount}/${maxResources})`);
+  }
+
+  // Oversized payloads are rejected outright - skip walking every job and
+  // shift just to report window/break details nobody can act on yet
+  if (jobCount > maxJobs || resourceCount > maxResources) {
+    return {
+      valid: false,
+      errors,
+      warnings,
+      actualComplexity: {
+        jobCount,
+        resourceCount,
+      },
+    };
+  }
+
   // Check time windows per job
   let maxTimeWindows = 0;
   let totalTimeWindows = 0;
 
-  vrpData.jobs?.forEach((job, idx) => {
-    const windowCount = job.windows?.length || 0;
+  const jobs = vrpData.jobs ?? [];
+  for (let idx = 0; idx < jobs.length; idx++) {
+    const windowCount = jobs[idx].windows?.length || 0;
     totalTimeWindows += windowCount;
 
     if (windowCount > maxTimeWindows) {
       maxTimeWindows = windowCount;
     }
 
-    if (windowCount > limits.maxTimeWindowsPerJob) {
-      errors.push(
-        `Job "${job.name || idx}" has ${windowCount} time windows (maximum ${limits.maxTimeWindowsPerJob} for demo)`
-      );
+    if (windowCount > maxTimeWindowsPerJob) {
+      errors.push(jobWindowsError(jobs[idx].name || idx, windowCount, maxTimeWindowsPerJob));
     }
-  });
+  }
 
   // Check breaks per resource
-  vrpData.resources?.forEach((resource, idx) => {
-    resource.shifts?.forEach((shift, shiftIdx) => {
-      const breakCount = shift.breaks?.length || 0;
-
-      if (breakCount > limits.maxBreaksPerResource) {
-        errors.push(
-          `Resource "${resource.name || idx}" shift ${shiftIdx} has ${breakCount} breaks (maximum ${limits.maxBreaksPerResource} for demo)`
-        );
-      }
-    });
-  });
+  const resources = vrpData.resources ?? [];
+  for (let idx = 0; idx < resources.length; idx++) {
+    const shifts = resources[idx].shifts;
+    if (!shifts) continue;
 
-  // Warnings for approaching limits
-  if (jobCount > limits.maxJobs * 0.8) {
-    warnings.push(`Approaching job limit (${jobCount}/${limits.maxJobs})`);
-  }
+    for (let shiftIdx = 0; shiftIdx < shifts.length; shiftIdx++) {
+      const breakCount = shifts[shiftIdx].breaks?.length || 0;
+      if (breakCount <= maxBreaksPerResource) continue;
 
-  if (resourceCount > limits.maxResources * 0.8) {
-    warnings.push(`Approaching resource limit (${resourceCount}/${limits.maxResources})`);
+      errors.push(shiftBreaksError(resources[idx].name || idx, shiftIdx, breakCount, maxBreaksPerResource));
+    }
   }
 
   return {
@@ -126,6 +149,10 @@ export function validateComplexity(
   };
 }
 
+// Upsell footer appended to every complexity error message
+const COMPLEXITY_ERROR_FOOTER =
+  '\n\nSign up for a free account to unlock:\n• 100 jobs (5x more)\n• 10 vehicles\n• Advanced features';
+
 /**
  * Get user-friendly error message for complexity violations
  */
@@ -136,7 +163,7 @@ export function getComplexityErrorMessage(result: ComplexityCheckResult): string
 
   const errorList = result.errors.map((err, idx) => `${idx + 1}. ${err}`).join('\n');
 
-  return `VRP problem too complex for demo:\n\n${errorList}\n\nSign up for a free account to unlock:\n• 100 jobs (5x more)\n• 10 vehicles\n• Advanced features`;
+  return `VRP problem too complex for demo:\n\n${errorList}${COMPLEXITY_ERROR_FOOTER}`;
 }
 
 /**
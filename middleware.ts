@@ -1,4 +1,5 @@
 import { NextRequest, NextResponse } from 'next/server';
+import { MAX_REQUEST_SIZE, payloadTooLargeResponse } from '@/lib/request-body';
 
 /**
  * Middleware for request validation and security
@@ -8,9 +9,6 @@ import { NextRequest, NextResponse } from 'next/server';
  * - Content-Type validation for API routes
  */
 
-// Maximum request body size in bytes (1MB)
-const MAX_REQUEST_SIZE = 1_000_000; // 1MB
-
 export function middleware(request: NextRequest) {
   const { pathname } = request.nextUrl;
 
@@ -22,22 +20,15 @@ export function middleware(request: NextRequest) {
   // Check Content-Length header
   const contentLength = request.headers.get('content-length');
 
+  // Bodies without a declared length (e.g. chunked uploads) are capped by
+  // readJsonBody in the route handlers instead
   if (contentLength) {
     const size = parseInt(contentLength, 10);
 
     if (size > MAX_REQUEST_SIZE) {
       console.warn(`⚠️  Request too large: ${size} bytes (max: ${MAX_REQUEST_SIZE})`);
 
-      return NextResponse.json(
-        {
-          error: 'Request too large',
-          message: `Request body exceeds maximum size of ${(MAX_REQUEST_SIZE / 1_000_000).toFixed(1)}MB`,
-          type: 'payload_too_large',
-          maxSize: MAX_REQUEST_SIZE,
-          actualSize: size,
-        },
-        { status: 413 } // Payload Too Large
-      );
+      return payloadTooLargeResponse(size);
     }
   }
 